@@ -121,11 +121,10 @@ class BrowserInterface:
             log_path = os.path.join(os.getcwd(), "logs", "proxy.log")
             os.makedirs(os.path.dirname(log_path), exist_ok=True)
             handler = logging.FileHandler(log_path, encoding="utf-8")
-            from app.utils.gui_logging import PROFILE_FILTER, ProfileFormatter
+            from app.utils.gui_logging import ProfileFormatter
 
             fmt = ProfileFormatter("%(asctime)s %(levelname)s [%(profile)s] %(message)s")
             handler.setFormatter(fmt)
-            handler.addFilter(PROFILE_FILTER)
             proxy_logger.addHandler(handler)
         proxy_logger.propagate = True
         return logging.LoggerAdapter(proxy_logger, {"profile": self.profile_name})
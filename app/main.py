@@ -6,7 +6,7 @@ import logging
 import os
 import sys
 
-from app.utils.gui_logging import LOG_FORMAT, PROFILE_FILTER, ProfileFormatter
+from app.utils.gui_logging import LOG_FORMAT, ProfileFormatter
 from app.storage.db import init_db
 from app.ui.qml_app import run_qml_app
 
@@ -25,12 +25,8 @@ def main() -> None:
         format=LOG_FORMAT,
     )
     root_logger = logging.getLogger()
-    if PROFILE_FILTER not in root_logger.filters:
-        root_logger.addFilter(PROFILE_FILTER)
     for handler in root_logger.handlers:
         handler.setFormatter(ProfileFormatter(LOG_FORMAT))
-        if PROFILE_FILTER not in handler.filters:
-            handler.addFilter(PROFILE_FILTER)
     logging.getLogger("httpx").setLevel(logging.WARNING)
     logging.getLogger("httpcore").setLevel(logging.WARNING)
 
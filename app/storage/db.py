@@ -5,6 +5,7 @@ import re
 import shutil
 import sys
 import tempfile
+import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
@@ -390,6 +391,11 @@ def db_update_account(account_name: str, updates: Dict[str, Any]) -> None:
             pass
 
 
+# Serializes read-modify-write cycles on settings.json; the UI persists some
+# settings from a background writer thread.
+_SETTINGS_LOCK = threading.RLock()
+
+
 def _load_settings() -> Dict[str, str]:
     try:
         data = json.loads(SETTINGS_FILE.read_text(encoding="utf-8"))
@@ -434,9 +440,10 @@ def db_get_setting(key: str) -> Optional[str]:
 
 
 def db_set_setting(key: str, value: str) -> None:
-    settings = _load_settings()
-    settings[key] = value
-    _save_settings(settings)
+    with _SETTINGS_LOCK:
+        settings = _load_settings()
+        settings[key] = value
+        _save_settings(settings)
 
 
 def db_get_camoufox_defaults() -> Dict[str, Any]:
@@ -518,16 +525,17 @@ def db_get_selector_index(selector: str) -> Optional[int]:
 
 
 def db_set_selector_index(selector: str, index: int) -> None:
-    settings = _load_settings()
-    mapping = settings.get("selector_indices")
-    if not isinstance(mapping, dict):
-        mapping = {}
-    try:
-        mapping[str(selector)] = int(index)
-    except Exception:
-        mapping[str(selector)] = index
-    settings["selector_indices"] = mapping
-    _save_settings(settings)
+    with _SETTINGS_LOCK:
+        settings = _load_settings()
+        mapping = settings.get("selector_indices")
+        if not isinstance(mapping, dict):
+            mapping = {}
+        try:
+            mapping[str(selector)] = int(index)
+        except Exception:
+            mapping[str(selector)] = index
+        settings["selector_indices"] = mapping
+        _save_settings(settings)
 
 
 def db_set_selector_indices(mapping: Dict[str, int]) -> None:
@@ -537,19 +545,21 @@ def db_set_selector_indices(mapping: Dict[str, int]) -> None:
         normalized = {str(k): int(v) for k, v in mapping.items()}
     except Exception:
         normalized = {str(k): v for k, v in mapping.items()}
-    settings = _load_settings()
-    settings["selector_indices"] = normalized
-    _save_settings(settings)
+    with _SETTINGS_LOCK:
+        settings = _load_settings()
+        settings["selector_indices"] = normalized
+        _save_settings(settings)
 
 
 def db_delete_selector_index(selector: str) -> None:
-    settings = _load_settings()
-    mapping = settings.get("selector_indices")
-    if not isinstance(mapping, dict):
-        return
-    mapping.pop(str(selector), None)
-    settings["selector_indices"] = mapping
-    _save_settings(settings)
+    with _SETTINGS_LOCK:
+        settings = _load_settings()
+        mapping = settings.get("selector_indices")
+        if not isinstance(mapping, dict):
+            return
+        mapping.pop(str(selector), None)
+        settings["selector_indices"] = mapping
+        _save_settings(settings)
 
 
 def db_get_scenarios() -> List[Scenario]:
@@ -13,6 +13,7 @@ from app.storage.db import db_get_setting, db_set_setting
 from app.services.server_client import ServerClient, ServerClientError, server_enabled
 from app.ui.bridge.cloud_permissions import allows, deny_message
 from app.ui.bridge.models import DictListModel
+from app.utils.parsing import unique_proxy_values
 
 
 class ProxiesBridge(QObject):
@@ -345,7 +346,7 @@ class ProxiesBridge(QObject):
     def addProxies(self, values: str) -> None:  # noqa: N802
         if not self._ensure_allowed("manager"):
             return
-        lines = [line.strip() for line in str(values or "").replace("\r", "\n").split("\n") if line.strip()]
+        lines = unique_proxy_values(str(values or ""))
         if not lines:
             self._emit_message("Proxy list is empty")
             return
@@ -369,13 +370,9 @@ class ProxiesBridge(QObject):
         pool = pools.setdefault(pool_name, {"proxies": []})
         proxies = pool.setdefault("proxies", [])
         existing = {str(item.get("value") or "") for item in proxies if isinstance(item, dict)}
-        added = 0
-        for value in lines:
-            if value in existing:
-                continue
-            proxies.append({"value": value, "assigned_to": ""})
-            existing.add(value)
-            added += 1
+        new_values = [value for value in lines if value not in existing]
+        proxies.extend({"value": value, "assigned_to": ""} for value in new_values)
+        added = len(new_values)
         self._selected_pool = pool_name
         self._save(pools)
         self._emit_message(f"Added {added} proxies to {pool_name}")
@@ -1,6 +1,22 @@
 """Main window package."""
 
-from .window import MainWindow
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
 __all__ = ["MainWindow"]
 
+if TYPE_CHECKING:
+    from .window import MainWindow
+
+
+def __getattr__(name: str):
+    if name == "MainWindow":
+        from .window import MainWindow as value
+
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals().keys()) + __all__)
@@ -10,6 +10,7 @@ import shutil
 import sqlite3
 import tempfile
 import threading
+import time
 import weakref
 from PyQt6.QtCore import QPoint, Qt, QSize
 from PyQt6.QtGui import QBrush, QFont, QGuiApplication, QIcon, QPainter, QPalette, QPixmap
@@ -38,7 +39,8 @@ from PyQt6.QtWidgets import (
     QVBoxLayout,
     QWidget,
 )
-from app.utils.parsing import DEFAULT_ACCOUNT_TEMPLATE, parse_account_line
+from app.ui.tabs.utils import bulk_update
+from app.utils.parsing import DEFAULT_ACCOUNT_TEMPLATE, AccountLineError, parse_account_lines
 from app.storage.db import (
     cleanup_profiles,
     clear_profile_cookies,
@@ -54,6 +56,8 @@ from app.storage.db import (
 )
 from app.core.browser_interface import cloakbrowser_profile_dir, load_or_create_cloakbrowser_seed
 
+# Distinct (query, stage) filter results kept until the profile snapshot is rebuilt.
+_ACCOUNTS_FILTER_CACHE_SIZE = 16
 
 class AccountsMixin:
     def _open_import_dialog(self) -> None:
@@ -159,12 +163,12 @@ class AccountsMixin:
                 if val:
                     parsed_preview.append(f"{key}={val}")
             preview_str = "; ".join(parsed_preview)
-            display = f"{acc_id} {proxy_info}  |  tag {scenario}"
-            if preview_str:
-                display += f"  |  {preview_str}"
+            # lowercased once here so the filter only does substring / equality checks per row
             search_blob = f"{acc_id} {proxy_info} {scenario} {preview_str}".lower()
-            snapshot.append({"account": dict(acc), "search": search_blob})
+            stage_key = str(acc.get("stage") or "").lower()
+            snapshot.append({"account": dict(acc), "search": search_blob, "stage": stage_key})
         self._accounts_snapshot = snapshot
+        self._accounts_filter_cache.clear()
         if hasattr(self, "profile_count_label"):
             self.profile_count_label.setText(f"{len(snapshot)} profiles")
         if hasattr(self, "profile_status_label"):
@@ -177,6 +181,7 @@ class AccountsMixin:
             self._refresh_dashboard()
         if hasattr(self, "_refresh_cookies_profile_list"):
             self._refresh_cookies_profile_list()
+        self._accounts_refreshed_at = time.monotonic()
 
     def _refresh_delete_tag_combo(self) -> None:
         combo = getattr(self, "delete_tag_combo", None)
@@ -229,7 +234,7 @@ class AccountsMixin:
         name_meta = QVBoxLayout()
         name_meta.setSpacing(2)
         primary_name = QLabel(str(acc.get("name") or "Profile"))
-        primary_name.setProperty("class", "cardTitle")
+        primary_name.setObjectName("cardTitle")
         name_meta.addWidget(primary_name)
         subtitle = acc.get("description") or "No description"
         subtitle_label = QLabel(subtitle)
@@ -257,7 +262,7 @@ class AccountsMixin:
         proxy_row = QHBoxLayout()
         proxy_row.setSpacing(8)
         proxy_main = QLabel(proxy_label)
-        proxy_main.setProperty("class", "cardTitle")
+        proxy_main.setObjectName("cardTitle")
         proxy_row.addWidget(proxy_main)
         pool_label = QLabel(pool_name)
         pool_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
@@ -316,7 +321,7 @@ class AccountsMixin:
         painter.end()
         more_btn.setIcon(QIcon(pixmap))
         more_btn.setIconSize(QSize(icon_size, icon_size))
-        more_btn.setProperty("class", "ghost iconButton")
+        more_btn.setProperty("class", "ghost")
         more_btn.setFixedWidth(36)
         more_btn.setFixedHeight(32)
         more_btn.clicked.connect(
@@ -364,6 +369,9 @@ class AccountsMixin:
             return
         for widget, item in self._account_row_widgets.items():
             selected = bool(item.isSelected())
+            # Only rows whose state flipped need the (per-widget) stylesheet re-polish.
+            if bool(widget.property("selected")) == selected:
+                continue
             widget.setProperty("selected", selected)
             style = widget.style()
             if style is not None:
@@ -372,6 +380,8 @@ class AccountsMixin:
             widget.update()
 
     def _apply_accounts_filter(self) -> None:
+        # a direct refresh supersedes a debounced one still waiting on the search box
+        self._accounts_filter_timer.stop()
         if not hasattr(self, "accounts_list"):
             return
         query = ""
@@ -382,25 +392,36 @@ class AccountsMixin:
             widget.removeEventFilter(self)
         self._account_row_widgets = {}
         self._account_action_buttons = {}
-        self.accounts_list.clear()
-        for record in self._accounts_snapshot:
-            acc = record.get("account") or {}
-            blob = str(record.get("search") or "")
-            if query and query not in blob:
-                continue
-            scenario_value = str(acc.get("stage") or "").lower()
-            if stage_filter and scenario_value != stage_filter:
-                continue
-            acc_id = str(acc.get("name") or "")
-            item = QListWidgetItem()
-            item.setData(Qt.ItemDataRole.UserRole, acc_id)
-            item.setData(Qt.ItemDataRole.UserRole + 1, acc.get("stage"))
-            row_widget = self._build_account_row_widget(acc, item)
-            item.setSizeHint(row_widget.sizeHint())
-            self.accounts_list.addItem(item)
-            self.accounts_list.setItemWidget(item, row_widget)
+        with bulk_update(self.accounts_list):
+            self.accounts_list.clear()
+            for row in self._visible_account_rows(query, stage_filter):
+                acc = self._accounts_snapshot[row].get("account") or {}
+                acc_id = str(acc.get("name") or "")
+                item = QListWidgetItem()
+                item.setData(Qt.ItemDataRole.UserRole, acc_id)
+                item.setData(Qt.ItemDataRole.UserRole + 1, acc.get("stage"))
+                row_widget = self._build_account_row_widget(acc, item)
+                item.setSizeHint(row_widget.sizeHint())
+                self.accounts_list.addItem(item)
+                self.accounts_list.setItemWidget(item, row_widget)
         self._update_row_selection_styles()
 
+    def _visible_account_rows(self, query: str, stage_filter: str) -> Tuple[int, ...]:
+        # snapshot rows matching the filter; the cache is reset whenever the snapshot is rebuilt
+        key = (query, stage_filter)
+        rows = self._accounts_filter_cache.get(key)
+        if rows is None:
+            rows = tuple(
+                idx
+                for idx, record in enumerate(self._accounts_snapshot)
+                if (not query or query in record["search"])
+                and (not stage_filter or record["stage"] == stage_filter)
+            )
+            if len(self._accounts_filter_cache) >= _ACCOUNTS_FILTER_CACHE_SIZE:
+                self._accounts_filter_cache.pop(next(iter(self._accounts_filter_cache)))
+            self._accounts_filter_cache[key] = rows
+        return rows
+
     def _import_accounts(
         self,
         accounts_raw: str,
@@ -422,17 +443,19 @@ class AccountsMixin:
             template_value = DEFAULT_ACCOUNT_TEMPLATE
         self._save_account_template(template_value)
 
+        try:
+            accounts = parse_account_lines(acc_lines, template_value)
+        except ValueError as e:
+            # a template without placeholders fails before any line is looked at
+            detail = f"{e}\nLine:\n{e.line}" if isinstance(e, AccountLineError) else str(e)
+            QMessageBox.warning(self, "Account line error", detail)
+            return None
+
         added = 0
         skipped = 0
         remaining: List[str] = []
 
-        for idx, line in enumerate(acc_lines):
-            try:
-                account = parse_account_line(line, template_value)
-            except ValueError as e:
-                QMessageBox.warning(self, "Account line error", f"{e}\nLine:\n{line}")
-                return None
-
+        for idx, account in enumerate(accounts):
             account["stage"] = stage_name or account.get("stage")
 
             try:
@@ -1042,7 +1065,7 @@ class AccountsMixin:
         cookies_tab = QWidget(tabs)
         cookies_layout = QVBoxLayout(cookies_tab)
         cookies_title = QLabel("Cookies for this profile")
-        cookies_title.setProperty("class", "cardTitle")
+        cookies_title.setObjectName("cardTitle")
         cookies_layout.addWidget(cookies_title)
         cookies_hint = QLabel("Chromium profiles may store encrypted cookie values on Windows.")
         cookies_hint.setProperty("class", "muted")
@@ -5,10 +5,16 @@ from __future__ import annotations
 import logging
 import os
 import threading
+from typing import Iterable, Tuple
+
 from PyQt6.QtCore import QEvent, Qt
 from PyQt6.QtGui import QPalette
 from PyQt6.QtWidgets import QApplication, QWidget
-from app.utils.gui_logging import GuiLogHandler, LOG_FORMAT, PROFILE_FILTER, ProfileFormatter
+from app.ui.tabs.logs import build_log_view
+from app.utils.gui_logging import GuiLogHandler, LOG_FORMAT, ProfileFormatter
+
+# Lines kept by the log view and its backlog; also how much of ui.log is reloaded.
+LOG_MAX_LINES = 5000
 
 
 class LoggingMixin:
@@ -34,9 +40,7 @@ class LoggingMixin:
         except Exception:
             return
 
-    def _load_ui_log_from_file(self, max_lines: int = 5000) -> None:
-        if not hasattr(self, "log_edit"):
-            return
+    def _load_ui_log_from_file(self, max_lines: int = LOG_MAX_LINES) -> None:
         path = self._ui_log_path()
         if not os.path.exists(path):
             return
@@ -47,6 +51,12 @@ class LoggingMixin:
             return
         if max_lines and len(lines) > max_lines:
             lines = lines[-max_lines:]
+        if not hasattr(self, "log_edit"):
+            # The log view is not built yet; it replays the backlog when it is. The file
+            # already holds anything logged so far, so it replaces the backlog outright.
+            self._log_backlog.clear()
+            self._log_backlog.extend((line, logging.INFO) for line in lines)
+            return
         try:
             self._suppress_ui_log_persist = True
             self.log_edit.setPlainText("\n".join(lines))
@@ -61,24 +71,57 @@ class LoggingMixin:
         self._append_log_message(text, level)
 
     def _append_log_message(self, text: str, level: int) -> None:
-        if not hasattr(self, "log_edit"):
+        # Coalesced: a burst of lines costs one document edit, one file write and one
+        # dashboard refresh instead of one of each per line.
+        self._log_pending.append((text, level))
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_log_messages(self) -> None:
+        pending = self._log_pending
+        if not pending:
             return
+        self._log_pending = []
+        if hasattr(self, "log_edit"):
+            self._insert_log_lines(pending)
+        else:
+            self._log_backlog.extend(pending)
+        self._append_ui_log_to_file("\n".join(text for text, _ in pending))
+        if hasattr(self, "_refresh_dashboard_activity"):
+            self._refresh_dashboard_activity()
+
+    def _insert_log_lines(self, entries: Iterable[Tuple[str, int]]) -> None:
         edit = self.log_edit
         if self._log_default_color is None:
             palette = edit.palette()
             self._log_default_color = palette.color(QPalette.ColorRole.Text)
         cursor = edit.textCursor()
         cursor.movePosition(cursor.MoveOperation.End)
-        fmt = cursor.charFormat()
-        color = self._log_error_color if level >= logging.ERROR else self._log_default_color
-        if color is not None:
-            fmt.setForeground(color)
-        cursor.insertText(text + "\n", fmt)
+        cursor.beginEditBlock()
+        for text, level in entries:
+            fmt = cursor.charFormat()
+            color = self._log_error_color if level >= logging.ERROR else self._log_default_color
+            if color is not None:
+                fmt.setForeground(color)
+            cursor.insertText(text + "\n", fmt)
+        cursor.endEditBlock()
         edit.setTextCursor(cursor)
         edit.ensureCursorVisible()
-        self._append_ui_log_to_file(text)
-        if hasattr(self, "_refresh_dashboard_activity"):
-            self._refresh_dashboard_activity()
+
+    def _ensure_log_view(self) -> None:
+        """Build the logs tab's text view on first use and replay what was logged so far."""
+        if hasattr(self, "log_edit"):
+            return
+        build_log_view(self, LOG_MAX_LINES)
+        backlog = self._log_backlog
+        if backlog:
+            self._insert_log_lines(backlog)
+            backlog.clear()
+
+    def _log_plain_text(self) -> str:
+        if hasattr(self, "log_edit"):
+            return self.log_edit.toPlainText()
+        return "\n".join(text for text, _ in self._log_backlog)
 
     def _install_log_handler(self) -> None:
         if getattr(self, "_gui_log_handler", None):
@@ -88,16 +131,10 @@ class LoggingMixin:
             self._log_default_color = palette.color(QPalette.ColorRole.Text)
         handler = GuiLogHandler()
         handler.setLevel(logging.INFO)
-        handler.setFormatter(ProfileFormatter(LOG_FORMAT))
-        handler.addFilter(PROFILE_FILTER)
         handler.connect(self._append_log_message)
         root_logger = logging.getLogger()
-        if PROFILE_FILTER not in root_logger.filters:
-            root_logger.addFilter(PROFILE_FILTER)
         for existing_handler in root_logger.handlers:
             existing_handler.setFormatter(ProfileFormatter(LOG_FORMAT))
-            if PROFILE_FILTER not in existing_handler.filters:
-                existing_handler.addFilter(PROFILE_FILTER)
         root_logger.addHandler(handler)
         root_logger.setLevel(logging.INFO)
         logging.getLogger("httpx").setLevel(logging.WARNING)
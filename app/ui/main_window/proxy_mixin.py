@@ -13,9 +13,9 @@ import time
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QBrush, QColor
 from PyQt6.QtWidgets import QListWidgetItem, QInputDialog, QMessageBox, QMenu
-from app.utils.parsing import parse_proxy_line
+from app.ui.tabs.utils import bulk_update
+from app.utils.parsing import parse_proxy_line, unique_proxy_values
 from app.storage.db import db_get_accounts, db_get_setting, db_set_setting, db_update_account
 
 
@@ -373,21 +373,20 @@ class ProxyPoolMixin:
         widget = getattr(self, "proxy_pool_list", None)
         if widget is None:
             return
-        widget.blockSignals(True)
         current = self._selected_proxy_pool
-        widget.clear()
-        for name in sorted(self.proxy_pools):
-            pool = self.proxy_pools[name]
-            proxies = pool.get("proxies", [])
-            total = len(proxies)
-            busy = sum(1 for p in proxies if p.get("assigned_to"))
-            text = f"{name}  •  {total} proxies ({busy} used)"
-            item = QListWidgetItem(text)
-            item.setData(Qt.ItemDataRole.UserRole, name)
-            widget.addItem(item)
-            if current == name:
-                widget.setCurrentItem(item)
-        widget.blockSignals(False)
+        with bulk_update(widget):
+            widget.clear()
+            for name in sorted(self.proxy_pools):
+                pool = self.proxy_pools[name]
+                proxies = pool.get("proxies", [])
+                total = len(proxies)
+                busy = sum(1 for p in proxies if p.get("assigned_to"))
+                text = f"{name}  •  {total} proxies ({busy} used)"
+                item = QListWidgetItem(text)
+                item.setData(Qt.ItemDataRole.UserRole, name)
+                widget.addItem(item)
+                if current == name:
+                    widget.setCurrentItem(item)
 
     def _refresh_proxy_pool_detail(self) -> None:
         title = getattr(self, "proxy_pool_title", None)
@@ -395,8 +394,9 @@ class ProxyPoolMixin:
         list_widget = getattr(self, "proxy_items_list", None)
         if list_widget is None:
             return
-        list_widget.clear()
+        model = list_widget.model()
         if not self._selected_proxy_pool or self._selected_proxy_pool not in self.proxy_pools:
+            model.set_rows([])
             if title:
                 title.setText("Select a pool")
             if stats:
@@ -409,6 +409,7 @@ class ProxyPoolMixin:
         if stats:
             busy = sum(1 for item in proxies if item.get("assigned_to"))
             stats.setText(f"{len(proxies)} proxies, {busy} used")
+        rows: List[Tuple[str, str, Optional[str], int]] = []
         for idx, entry in enumerate(proxies):
             proxy_value = str(entry.get("value") or "")
             assigned = str(entry.get("assigned_to") or "")
@@ -416,16 +417,16 @@ class ProxyPoolMixin:
             check_meta = entry.get("last_check") if isinstance(entry, dict) else None
             prefix = ""
             tooltip_extra = ""
-            item_color: Optional[QColor] = None
+            item_color: Optional[str] = None
             if isinstance(check_meta, dict):
                 status = str(check_meta.get("status") or "")
                 ms = check_meta.get("ms")
                 if status == "ok":
                     prefix = "[OK]"
-                    item_color = QColor("#2ecc71")
+                    item_color = "#2ecc71"
                 elif status == "fail":
                     prefix = "[FAIL]"
-                    item_color = QColor("#ff4d4f")
+                    item_color = "#ff4d4f"
                 elif status == "checking":
                     prefix = "[…]"
                 mode = str(check_meta.get("mode") or "")
@@ -459,15 +460,8 @@ class ProxyPoolMixin:
                 display = f"{prefix} {display}"
             if assigned:
                 display += f"  •  {assigned}"
-            item = QListWidgetItem(display)
-            item.setData(Qt.ItemDataRole.UserRole, idx)
-            if item_color is not None:
-                item.setForeground(QBrush(item_color))
-            if tooltip_extra:
-                item.setToolTip(display + tooltip_extra)
-            else:
-                item.setToolTip(display)
-            list_widget.addItem(item)
+            rows.append((display, display + tooltip_extra, item_color, idx))
+        model.set_rows(rows)
 
     def _current_proxy_pool(self) -> Tuple[Optional[str], Optional[Dict[str, object]]]:
         if not self._selected_proxy_pool:
@@ -554,17 +548,13 @@ class ProxyPoolMixin:
         text_edit = getattr(self, "proxy_batch_input", None)
         if text_edit is None:
             return
-        lines = [ln.strip() for ln in text_edit.toPlainText().splitlines() if ln.strip()]
-        if not lines:
+        text = text_edit.toPlainText()
+        if not text.strip():
             return
-        existing = {entry.get("value") for entry in pool.get("proxies", [])}
-        added = 0
-        for value in lines:
-            if value in existing:
-                continue
-            pool.setdefault("proxies", []).append({"value": value, "assigned_to": ""})
-            existing.add(value)
-            added += 1
+        proxies = pool.setdefault("proxies", [])
+        values = unique_proxy_values(text, (entry.get("value") for entry in proxies))
+        proxies.extend({"value": value, "assigned_to": ""} for value in values)
+        added = len(values)
         if added:
             text_edit.clear()
             self._save_proxy_pools()
@@ -577,8 +567,8 @@ class ProxyPoolMixin:
         if list_widget is None:
             return []
         indices: List[int] = []
-        for item in list_widget.selectedItems():
-            idx = item.data(Qt.ItemDataRole.UserRole)
+        for index in list_widget.selectionModel().selectedRows():
+            idx = index.data(Qt.ItemDataRole.UserRole)
             if isinstance(idx, int):
                 indices.append(idx)
         return sorted(set(indices))
@@ -769,7 +759,7 @@ class ProxyPoolMixin:
         list_widget = getattr(self, "proxy_items_list", None)
         if list_widget is None:
             return
-        if not list_widget.itemAt(pos):
+        if not list_widget.indexAt(pos).isValid():
             return
         menu = QMenu(self)
         act_check = menu.addAction("Check internet")
@@ -31,7 +31,8 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 from app.storage.db import db_delete_scenario, db_get_scenario, db_get_scenarios, db_save_scenario
-from app.ui.tabs.scenarios import ACTION_LABELS, ACTION_OPTIONS_DIALOG
+from app.ui.tabs.scenarios import ACTION_LABELS, ACTION_OPTIONS_DIALOG, build_step_form
+from app.ui.tabs.utils import bulk_update
 
 _ACTION_CATEGORY_PRESETS = [
     ("Navigation & interaction", ["goto", "wait_for_load_state", "wait_element", "sleep", "click", "type"]),
@@ -165,13 +166,14 @@ class ScenarioEditorMixin:
 
     def _reload_scenarios(self) -> None:
         self.scenarios_cache = db_get_scenarios()
-        self.scenario_list_widget.clear()
+        names = [scenario.name for scenario in self.scenarios_cache]
+        # selection is (re)established below, outside the bulk block, so _on_scenario_selected still fires
+        with bulk_update(self.scenario_list_widget):
+            self.scenario_list_widget.clear()
+            self.scenario_list_widget.addItems(names)
         if hasattr(self, "scenario_run_combo"):
             self.scenario_run_combo.clear()
-        for scenario in self.scenarios_cache:
-            self.scenario_list_widget.addItem(scenario.name)
-            if hasattr(self, "scenario_run_combo"):
-                self.scenario_run_combo.addItem(scenario.name)
+            self.scenario_run_combo.addItems(names)
         if self.scenarios_cache:
             self.scenario_list_widget.setCurrentRow(0)
         else:
@@ -324,6 +326,7 @@ class ScenarioEditorMixin:
         if row < 0 or row >= len(self.current_steps):
             return
         self.map_view.set_selected(row)
+        self._ensure_step_form()
         step = self.current_steps[row] or {}
         self.step_tag_input.setText(step.get("tag", ""))
         self._select_action_value(step.get("action", "goto"))
@@ -517,7 +520,15 @@ class ScenarioEditorMixin:
         if total_label is not None:
             total_label.setText(str(len(self.current_steps)))
 
+    def _ensure_step_form(self) -> None:
+        """Build the hidden step form the first time something reads or fills it."""
+        if hasattr(self, "step_action_combo"):
+            return
+        build_step_form(self)
+        self._update_form_visibility(self._current_action_value())
+
     def _clear_step_form(self) -> None:
+        self._ensure_step_form()
         self.step_selector_input.clear()
         self.step_selector_type_input.setCurrentText("css")
         self.step_frame_input.clear()
@@ -552,6 +563,7 @@ class ScenarioEditorMixin:
         self._update_form_visibility(self._current_action_value())
 
     def _collect_step_from_form(self, existing_index: Optional[int] = None) -> Dict:
+        self._ensure_step_form()
         action = self._current_action_value()
         step: Dict[str, object] = {"action": action}
         existing_next_ok = None
@@ -774,18 +786,14 @@ class ScenarioEditorMixin:
         """
         if not hasattr(self, "map_view") or not getattr(self.map_view, "_last_positions", None):
             return
+        # The map keeps offset-free positions, which is exactly what _pos stores.
         positions = getattr(self.map_view, "_last_positions", {}) or {}
-        try:
-            ox = float(self.map_view.offset.x())
-            oy = float(self.map_view.offset.y())
-        except Exception:
-            ox = oy = 0.0
         for idx, step in enumerate(self.current_steps):
             if idx not in positions:
                 continue
             try:
                 x, y, w, h = positions[idx]
-                step["_pos"] = {"x": float(x - ox), "y": float(y - oy)}
+                step["_pos"] = {"x": float(x), "y": float(y)}
             except Exception:
                 continue
 
@@ -1578,6 +1586,8 @@ class ScenarioEditorMixin:
         self._update_form_visibility(action)
 
     def _update_form_visibility(self, action: str) -> None:
+        if not hasattr(self, "step_action_combo"):
+            return
         action = action or ""
         selector_actions = {"click", "type", "wait_element", "extract_text"}
         show_selector = action in selector_actions
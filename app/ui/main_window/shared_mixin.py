@@ -129,31 +129,26 @@ class SharedDataMixin:
         layout = getattr(self, "stage_filter_layout", None)
         if layout is None:
             return
-        while layout.count():
-            item = layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
-        if not self.stages:
-            placeholder = QLabel("Add tags to group accounts faster.")
-            placeholder.setProperty("class", "muted")
-            layout.addWidget(placeholder)
-            layout.addStretch()
-            return
-        clear_btn = QPushButton("All tags")
-        clear_btn.setCheckable(True)
-        clear_btn.setProperty("class", "tagChip")
-        clear_btn.setChecked(self._active_stage_filter is None)
-        clear_btn.clicked.connect(lambda _: self._set_stage_filter(None))
-        layout.addWidget(clear_btn)
-        for stage in sorted(self.stages):
-            btn = QPushButton(stage)
+        stages = sorted(self.stages)
+        self._stage_filter_placeholder.setVisible(not stages)
+        self._stage_filter_all_btn.setVisible(bool(stages))
+        self._stage_filter_all_btn.setChecked(self._active_stage_filter is None)
+        pool: List[QPushButton] = self._chip_pool
+        while len(pool) < len(stages):
+            btn = QPushButton()
             btn.setCheckable(True)
             btn.setProperty("class", "tagChip")
+            btn.clicked.connect(lambda _, chip=btn: self._set_stage_filter(chip.property("stage")))
+            # keep the trailing stretch last
+            layout.insertWidget(layout.count() - 1, btn)
+            pool.append(btn)
+        for btn, stage in zip(pool, stages):
+            btn.setText(stage)
+            btn.setProperty("stage", stage)
             btn.setChecked(self._active_stage_filter == stage)
-            btn.clicked.connect(lambda _, value=stage: self._set_stage_filter(value))
-            layout.addWidget(btn)
-        layout.addStretch()
+            btn.setVisible(True)
+        for btn in pool[len(stages):]:
+            btn.setVisible(False)
 
     def _set_stage_filter(self, stage: Optional[str]) -> None:
         self._active_stage_filter = stage or None
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Callable, Dict, List, Optional, Tuple, cast
+import logging
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple, cast
 
-from PyQt6.QtCore import QSize, Qt, QTimer
+from PyQt6.QtCore import QSize, Qt, QThreadPool, QTimer, pyqtSlot
 from PyQt6.QtGui import QColor, QPixmap, QShowEvent
 from PyQt6.QtWidgets import (
     QApplication,
@@ -47,7 +50,7 @@ from app.storage.db import (
 )
 from app.ui.dashboard_data import build_dashboard_metrics, recent_log_lines
 from app.ui.icons import lucide_icon
-from app.ui.tabs.browser import build_browser_tab
+from app.ui.tabs.browser import build_browser_tab, build_engine_defaults_card
 from app.ui.tabs.cookies import build_cookies_tab, refresh_cookies_profile_list
 from app.ui.tabs.dashboard import build_dashboard_tab
 from app.ui.tabs.logs import build_logs_tab
@@ -59,15 +62,91 @@ from app.ui.tabs.settings import build_settings_tab
 from app.ui.style import DEFAULT_THEME, apply_modern_theme, normalize_theme
 
 from .accounts_mixin import AccountsMixin
-from .logging_mixin import LoggingMixin
+from .logging_mixin import LOG_MAX_LINES, LoggingMixin
 from .proxy_mixin import ProxyPoolMixin
 from .scenario_editor import ScenarioEditorMixin
 from .scenario_runner import ScenarioRunnerMixin
 from .shared_mixin import SharedDataMixin
 
+LOGGER = logging.LoggerAdapter(logging.getLogger(__name__), {"profile": "ui"})
+
+# Tab switches within this window reuse the profile list built by the last refresh.
+_ACCOUNTS_REFRESH_INTERVAL_S = 1.0
+# Log lines arriving within this window are written to the log view and ui.log together.
+_LOG_FLUSH_INTERVAL_MS = 50
+# Keystrokes in the profile search box within this window trigger a single re-filter.
+_ACCOUNTS_FILTER_DEBOUNCE_MS = 150
+
 BrowserControls = Dict[str, object]
 CamoufoxControls = BrowserControls
 
+_BOOL_KEYS = (
+    "block_webrtc",
+    "block_images",
+    "block_webgl",
+    "disable_coop",
+    "enable_cache",
+    "persistent_context",
+)
+_BOOL_DEFAULTS = tuple(bool(CAMOUFOX_DEFAULTS.get(key, False)) for key in _BOOL_KEYS)
+
+
+def _select_combo_index(combo: QComboBox, idx: int) -> None:
+    target = idx if idx >= 0 else 0
+    if combo.currentIndex() != target:
+        combo.setCurrentIndex(target)
+
+
+def _join_lines(items: List[object]) -> str:
+    if all(type(item) is str for item in items):
+        return "\n".join(cast(List[str], items))
+    return "\n".join([str(item) for item in items])
+
+
+def _lines_text(value: object) -> str:
+    if isinstance(value, list):
+        return "\n".join(str(v) for v in value if str(v))
+    return str(value or "").strip()
+
+
+def _flatten_overrides(payload: Dict[str, object], prefix: str, out: Dict[str, object]) -> None:
+    for key, value in payload.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            _flatten_overrides(value, f"{path}.", out)
+        elif value is not None:
+            out[path] = value
+
+
+class _CamoufoxView:
+    """Browser defaults resolved once into the shapes the settings form reads."""
+
+    __slots__ = (
+        "values",
+        "window_flat",
+        "nav",
+        "fonts",
+        "addons",
+        "exclude_addons",
+        "extension_paths",
+        "launch_args",
+    )
+
+    def __init__(self, values: Dict[str, object]) -> None:
+        self.values = values
+        self.window_flat: Dict[str, object] = {}
+        window_values = values.get("window_overrides")
+        if isinstance(window_values, dict):
+            _flatten_overrides(window_values, "", self.window_flat)
+        nav = values.get("navigator_overrides")
+        self.nav: Dict[str, object] = nav if isinstance(nav, dict) else {}
+        fonts = values.get("fonts")
+        self.fonts = _join_lines(fonts) if isinstance(fonts, list) else str(fonts or "")
+        self.addons = _lines_text(values.get("addons"))
+        self.exclude_addons = _lines_text(values.get("exclude_addons"))
+        self.extension_paths = _lines_text(values.get("extension_paths"))
+        self.launch_args = _lines_text(values.get("launch_args"))
+
 
 class MainWindow(
     ScenarioEditorMixin,
@@ -96,21 +175,39 @@ class MainWindow(
         self.camoufox_defaults: Dict[str, object] = {}
         self.cloakbrowser_defaults: Dict[str, object] = {}
         self._camoufox_controls: Optional[BrowserControls] = None
+        self._camoufox_form_dirty = True
+        # Settings writes run off the GUI thread; one worker keeps them in order.
+        self._settings_writer = QThreadPool(self)
+        self._settings_writer.setMaxThreadCount(1)
         self._ensure_start_step()
         self._load_camoufox_defaults()
         self._log_default_color: Optional[QColor] = None
         self._log_error_color = QColor("#ff4d4f")
+        # (text, level) logged before the logs tab built its view; replayed by _ensure_log_view.
+        self._log_backlog: Deque[Tuple[str, int]] = deque(maxlen=LOG_MAX_LINES)
+        self._log_pending: List[Tuple[str, int]] = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(_LOG_FLUSH_INTERVAL_MS)
+        self._log_flush_timer.timeout.connect(self._flush_log_messages)
+        self._accounts_filter_timer = QTimer(self)
+        self._accounts_filter_timer.setSingleShot(True)
+        self._accounts_filter_timer.setInterval(_ACCOUNTS_FILTER_DEBOUNCE_MS)
+        self._accounts_filter_timer.timeout.connect(self._apply_accounts_filter)
         self._map_focus_on_load = True
         self._accounts_snapshot: List[Dict[str, object]] = []
+        self._accounts_filter_cache: Dict[Tuple[str, str], Tuple[int, ...]] = {}
         self._active_stage_filter: Optional[str] = None
         self._nav_buttons: Dict[int, QPushButton] = {}
         self._account_row_widgets: Dict[QWidget, QListWidgetItem] = {}
         self.current_theme: str = DEFAULT_THEME
         self._theme_combo: Optional[QComboBox] = None
+        self._theme_index: Dict[str, int] = {}
         self._load_ui_theme_preference()
         app = QApplication.instance()
         if app:
             apply_modern_theme(app, self.current_theme)
+            app.aboutToQuit.connect(self._flush_log_messages)
         if hasattr(self, "_ensure_ui_invoker"):
             self._ensure_ui_invoker()
 
@@ -128,7 +225,7 @@ class MainWindow(
         settings_tab = build_settings_tab(self)
         self._dashboard_tab_index = self._stack.addWidget(dashboard_tab)
         self._profiles_tab_index = self._stack.addWidget(profiles_tab)
-        browser_index = self._stack.addWidget(browser_tab)
+        self._browser_tab_index = self._stack.addWidget(browser_tab)
         proxies_index = self._stack.addWidget(proxies_tab)
         scenarios_index = self._stack.addWidget(scenarios_tab)
         self._runner_tab_index = self._stack.addWidget(runner_tab)
@@ -143,7 +240,7 @@ class MainWindow(
             [
                 ("Dashboard", self._dashboard_tab_index, "layout-dashboard"),
                 ("Profiles", self._profiles_tab_index, "user"),
-                ("Browser", browser_index, "globe"),
+                ("Browser", self._browser_tab_index, "globe"),
                 ("Proxies", proxies_index, "network"),
                 ("Scenarios", scenarios_index, "workflow"),
                 ("Run", self._runner_tab_index, "play"),
@@ -242,7 +339,7 @@ class MainWindow(
         status_layout.setContentsMargins(14, 12, 14, 12)
         status_layout.setSpacing(2)
         status_title = QLabel("● System Active", status)
-        status_title.setProperty("class", "cardTitle")
+        status_title.setObjectName("cardTitle")
         status_subtitle = QLabel("v1.0.0", status)
         status_subtitle.setProperty("class", "subtle")
         status_layout.addWidget(status_title)
@@ -608,7 +705,7 @@ class MainWindow(
         window_info.setProperty("class", "muted")
         window_form.addRow(window_info)
         screen_header = QLabel("Screen metrics")
-        screen_header.setProperty("class", "cardTitle")
+        screen_header.setObjectName("cardTitle")
         window_form.addRow(screen_header)
         _add_window_int(window_form, "screen.availHeight", "Available height", 0, 10000)
         _add_window_int(window_form, "screen.availWidth", "Available width", 0, 10000)
@@ -620,7 +717,7 @@ class MainWindow(
         _add_window_int(window_form, "screen.pixelDepth", "Pixel depth", 0, 64)
 
         browser_header = QLabel("Browser window metrics")
-        browser_header.setProperty("class", "cardTitle")
+        browser_header.setObjectName("cardTitle")
         window_form.addRow(browser_header)
         _add_window_int(window_form, "browser.scrollMinX", "Scroll min X", -10000, 10000)
         _add_window_int(window_form, "browser.scrollMinY", "Scroll min Y", -10000, 10000)
@@ -635,7 +732,7 @@ class MainWindow(
         _add_window_double(window_form, "browser.devicePixelRatio", "Device pixel ratio", 0.1, 8.0, 0.1, 2)
 
         history_header = QLabel("History and scroll")
-        history_header.setProperty("class", "cardTitle")
+        history_header.setObjectName("cardTitle")
         window_form.addRow(history_header)
         _add_window_int(window_form, "history.length", "History length", 0, 500)
         fp_spacing_container, fp_spacing_spin, fp_spacing_toggle = _auto_spinbox(0, 2_147_483_647, 1, "fonts:spacing_seed")
@@ -670,7 +767,8 @@ class MainWindow(
         def _add_nav_bool(field: str, label: str) -> None:
             combo = _bool_combo()
             navigator_form.addRow(f"{label}:", combo)
-            navigator_controls[field] = {"type": "bool", "widget": combo}
+            data_index = {combo.itemData(i): i for i in range(combo.count())}
+            navigator_controls[field] = {"type": "bool", "widget": combo, "data_index": data_index}
 
         def _add_nav_int(field: str, label: str, minimum: int, maximum: int, step: int = 1, suffix: str = "") -> None:
             container, spin, toggle = _auto_spinbox(minimum, maximum, step, label.lower(), suffix)
@@ -833,18 +931,19 @@ class MainWindow(
             set_combo_item_enabled(headless_combo, "virtual", not is_cloak)
             if is_cloak and headless_combo.currentData() == "virtual":
                 idx = headless_combo.findData(False)
-                headless_combo.setCurrentIndex(idx if idx >= 0 else 0)
+                _select_combo_index(headless_combo, idx)
 
         engine_combo.currentIndexChanged.connect(lambda _: apply_visibility())
         cast(QCheckBox, controls["humanize"]).toggled.connect(lambda _: apply_visibility())
         apply_visibility()
 
     def _apply_camoufox_controls(self, controls: CamoufoxControls, values: Dict[str, object]) -> None:
+        view = _CamoufoxView(values)
         engine_combo = cast(QComboBox, controls.get("browser_engine"))
         if engine_combo is not None:
             engine_value = str(values.get("browser_engine") or getattr(self, "browser_engine", "camoufox"))
             idx = engine_combo.findData(engine_value)
-            engine_combo.setCurrentIndex(idx if idx >= 0 else 0)
+            _select_combo_index(engine_combo, idx)
 
         headless_combo = cast(QComboBox, controls["headless"])
         headless_value = values.get("headless", False)
@@ -857,7 +956,7 @@ class MainWindow(
             else:
                 headless_value = False
         idx = headless_combo.findData(headless_value)
-        headless_combo.setCurrentIndex(idx if idx >= 0 else 0)
+        _select_combo_index(headless_combo, idx)
 
         humanize_check = cast(QCheckBox, controls["humanize"])
         humanize_duration = cast(QDoubleSpinBox, controls["humanize_duration"])
@@ -884,12 +983,12 @@ class MainWindow(
         human_preset = cast(QComboBox, controls["human_preset"])
         preset_value = str(values.get("human_preset") or "default").strip().lower()
         preset_idx = human_preset.findData(preset_value)
-        human_preset.setCurrentIndex(preset_idx if preset_idx >= 0 else 0)
+        _select_combo_index(human_preset, preset_idx)
 
         cloak_platform = cast(QComboBox, controls["cloak_platform"])
         platform_value = str(values.get("platform") or "windows").strip().lower()
         platform_idx = cloak_platform.findData(platform_value)
-        cloak_platform.setCurrentIndex(platform_idx if platform_idx >= 0 else 0)
+        _select_combo_index(cloak_platform, platform_idx)
 
         cloak_fingerprint_seed = cast(QSpinBox, controls["cloak_fingerprint_seed"])
         try:
@@ -917,7 +1016,7 @@ class MainWindow(
         cloak_color_scheme = cast(QComboBox, controls["cloak_color_scheme"])
         color_value = str(values.get("color_scheme") or "").strip().lower()
         color_idx = cloak_color_scheme.findData(color_value)
-        cloak_color_scheme.setCurrentIndex(color_idx if color_idx >= 0 else 0)
+        _select_combo_index(cloak_color_scheme, color_idx)
 
         locale_input = cast(QLineEdit, controls["locale"])
         locale_toggle = cast(Callable[[bool], None], controls["locale_toggle"])
@@ -951,12 +1050,7 @@ class MainWindow(
         os_auto.setChecked(len(selected) == 0)
         os_auto.blockSignals(False)
 
-        fonts_edit = cast(QTextEdit, controls["fonts"])
-        fonts_value = values.get("fonts")
-        if isinstance(fonts_value, list):
-            fonts_edit.setPlainText("\n".join(str(v) for v in fonts_value))
-        else:
-            fonts_edit.setPlainText(str(fonts_value or ""))
+        cast(QTextEdit, controls["fonts"]).setPlainText(view.fonts)
 
         width_spin = cast(QSpinBox, controls["window_width"])
         height_spin = cast(QSpinBox, controls["window_height"])
@@ -992,35 +1086,18 @@ class MainWindow(
         else:
             webgl_renderer_toggle(True)
 
-        for key in (
-            "block_webrtc",
-            "block_images",
-            "block_webgl",
-            "disable_coop",
-            "enable_cache",
-            "persistent_context",
-        ):
+        for key, default in zip(_BOOL_KEYS, _BOOL_DEFAULTS):
             checkbox = cast(QCheckBox, controls[key])
-            checkbox.setChecked(bool(values.get(key, CAMOUFOX_DEFAULTS.get(key, False))))
+            checked = bool(values.get(key, default))
+            if checkbox.isChecked() != checked:
+                checkbox.setChecked(checked)
 
-        window_values = values.get("window_overrides")
-        if not isinstance(window_values, dict):
-            window_values = {}
         window_controls_map = cast(Dict[str, Dict[str, object]], controls.get("window_controls", {}))
-
-        def _value_from_path(payload: Dict[str, object], key_path: str) -> Optional[object]:
-            node: Optional[object] = payload
-            for part in key_path.split("."):
-                if not isinstance(node, dict):
-                    return None
-                node = node.get(part)
-            return node
-
         for key, meta in window_controls_map.items():
             widget = meta.get("widget")
             toggle = meta.get("toggle")
             entry_type = meta.get("type")
-            value = _value_from_path(window_values, key)
+            value = view.window_flat.get(key)
             if value is None:
                 if callable(toggle):
                     toggle(True)
@@ -1037,13 +1114,10 @@ class MainWindow(
             if callable(toggle):
                 toggle(False)
 
-        navigator_values = values.get("navigator_overrides")
-        if not isinstance(navigator_values, dict):
-            navigator_values = {}
         navigator_controls = cast(Dict[str, Dict[str, object]], controls.get("navigator", {}))
         for field, meta in navigator_controls.items():
             entry_type = meta.get("type")
-            payload = navigator_values.get(field)
+            payload = view.nav.get(field)
             if entry_type == "str":
                 widget = cast(QLineEdit, meta["widget"])
                 toggle = cast(Callable[[bool], None], meta["toggle"])
@@ -1058,7 +1132,7 @@ class MainWindow(
                 widget = cast(QTextEdit, meta["widget"])
                 toggle = cast(Callable[[bool], None], meta["toggle"])
                 if isinstance(payload, list):
-                    formatted = "\n".join(str(v) for v in payload)
+                    formatted = _join_lines(payload)
                 elif isinstance(payload, str):
                     formatted = payload.strip()
                 else:
@@ -1072,8 +1146,8 @@ class MainWindow(
             elif entry_type == "bool":
                 combo = cast(QComboBox, meta["widget"])
                 value = payload if isinstance(payload, bool) else None
-                idx = combo.findData(value)
-                combo.setCurrentIndex(idx if idx >= 0 else 0)
+                idx = cast(Dict[object, int], meta["data_index"]).get(value, -1)
+                _select_combo_index(combo, idx)
             elif entry_type == "int":
                 spin = cast(QSpinBox, meta["widget"])
                 toggle = cast(Callable[[bool], None], meta["toggle"])
@@ -1085,17 +1159,11 @@ class MainWindow(
                 else:
                     toggle(True)
 
-        def _apply_list_control(key: str, toggle_key: str, value: object) -> None:
+        def _apply_list_control(key: str, toggle_key: str, formatted: str) -> None:
             widget = controls.get(key)
             toggle = controls.get(toggle_key)
             if not widget or not callable(toggle):
                 return
-            if isinstance(value, list):
-                formatted = "\n".join(str(v) for v in value if str(v))
-            elif isinstance(value, str):
-                formatted = value.strip()
-            else:
-                formatted = ""
             if formatted:
                 cast(QTextEdit, widget).setPlainText(formatted)
                 toggle(False)
@@ -1103,22 +1171,10 @@ class MainWindow(
                 cast(QTextEdit, widget).clear()
                 toggle(True)
 
-        _apply_list_control("addons", "addons_toggle", values.get("addons"))
-        _apply_list_control("exclude_addons", "exclude_addons_toggle", values.get("exclude_addons"))
-
-        extension_paths = values.get("extension_paths")
-        extensions_edit = cast(QTextEdit, controls["extension_paths"])
-        if isinstance(extension_paths, list):
-            extensions_edit.setPlainText("\n".join(str(v) for v in extension_paths if str(v)))
-        else:
-            extensions_edit.setPlainText(str(extension_paths or "").strip())
-
-        launch_args = values.get("launch_args")
-        launch_args_edit = cast(QTextEdit, controls["launch_args"])
-        if isinstance(launch_args, list):
-            launch_args_edit.setPlainText("\n".join(str(v) for v in launch_args if str(v)))
-        else:
-            launch_args_edit.setPlainText(str(launch_args or "").strip())
+        _apply_list_control("addons", "addons_toggle", view.addons)
+        _apply_list_control("exclude_addons", "exclude_addons_toggle", view.exclude_addons)
+        cast(QTextEdit, controls["extension_paths"]).setPlainText(view.extension_paths)
+        cast(QTextEdit, controls["launch_args"]).setPlainText(view.launch_args)
 
     def _collect_camoufox_controls(self, controls: CamoufoxControls) -> Dict[str, object]:
         engine_combo = cast(QComboBox, controls["browser_engine"])
@@ -1139,12 +1195,6 @@ class MainWindow(
         width_spin = cast(QSpinBox, controls["window_width"])
         height_spin = cast(QSpinBox, controls["window_height"])
         window_widget = cast(QWidget, controls["window_widget"])
-        block_webrtc = cast(QCheckBox, controls["block_webrtc"])
-        block_images = cast(QCheckBox, controls["block_images"])
-        block_webgl = cast(QCheckBox, controls["block_webgl"])
-        disable_coop = cast(QCheckBox, controls["disable_coop"])
-        cache_check = cast(QCheckBox, controls["enable_cache"])
-        persistent_context = cast(QCheckBox, controls["persistent_context"])
         webgl_vendor = cast(QLineEdit, controls["webgl_vendor"])
         webgl_renderer = cast(QLineEdit, controls["webgl_renderer"])
         extension_paths = cast(QTextEdit, controls["extension_paths"])
@@ -1184,20 +1234,7 @@ class MainWindow(
             headless_value = False
 
         window_controls_map = cast(Dict[str, Dict[str, object]], controls.get("window_controls", {}))
-        window_overrides: Dict[str, object] = {}
-
-        def _assign_window_value(path: List[str], value: object) -> None:
-            if not path:
-                return
-            node: Dict[str, object] = window_overrides
-            for part in path[:-1]:
-                child = node.get(part)
-                if not isinstance(child, dict):
-                    child = {}
-                    node[part] = child
-                node = cast(Dict[str, object], child)
-            node[path[-1]] = value
-
+        window_flat: Dict[str, object] = {}
         for key, meta in window_controls_map.items():
             widget = cast(QWidget, meta.get("widget"))
             if widget is None or not widget.isVisible():
@@ -1209,7 +1246,15 @@ class MainWindow(
                 value = round(float(cast(QDoubleSpinBox, widget).value()), 4)
             else:
                 continue
-            _assign_window_value(key.split("."), value)
+            window_flat[key] = value
+
+        window_overrides: Dict[str, object] = {}
+        for key, value in window_flat.items():
+            *parents, leaf = key.split(".")
+            node = window_overrides
+            for part in parents:
+                node = cast(Dict[str, object], node.setdefault(part, {}))
+            node[leaf] = value
 
         navigator_controls = cast(Dict[str, Dict[str, object]], controls.get("navigator", {}))
         navigator_values: Dict[str, object] = {}
@@ -1260,12 +1305,6 @@ class MainWindow(
             "window_height": height_value,
             "screen_width": width_value,
             "screen_height": height_value,
-            "block_webrtc": block_webrtc.isChecked(),
-            "block_images": block_images.isChecked(),
-            "block_webgl": block_webgl.isChecked(),
-            "disable_coop": disable_coop.isChecked(),
-            "enable_cache": cache_check.isChecked(),
-            "persistent_context": persistent_context.isChecked(),
             "webgl_vendor": vendor_value,
             "webgl_renderer": renderer_value,
             "platform": str(cloak_platform.currentData() or "windows"),
@@ -1283,6 +1322,8 @@ class MainWindow(
             "window_overrides": window_overrides,
             "navigator_overrides": navigator_values,
         }
+        for key in _BOOL_KEYS:
+            result[key] = cast(QCheckBox, controls[key]).isChecked()
         if not fingerprint_seed_value:
             result.pop("fingerprint_seed", None)
         if engine_value == "cloakbrowser":
@@ -1343,8 +1384,8 @@ class MainWindow(
         self.browser_engine = db_get_browser_engine()
         self.camoufox_defaults = db_get_camoufox_defaults()
         self.cloakbrowser_defaults = db_get_cloakbrowser_defaults()
-        if self._camoufox_controls:
-            self._apply_camoufox_controls(self._camoufox_controls, self._active_browser_defaults())
+        self._camoufox_form_dirty = True
+        self._apply_camoufox_defaults_to_form()
 
     def _active_browser_defaults(self) -> Dict[str, object]:
         if getattr(self, "browser_engine", "camoufox") == "cloakbrowser":
@@ -1354,50 +1395,78 @@ class MainWindow(
         data["browser_engine"] = getattr(self, "browser_engine", "camoufox")
         return data
 
+    def _ensure_engine_defaults_card(self) -> None:
+        """Build the browser tab's engine defaults form the first time the tab is shown."""
+        if self._camoufox_controls is not None:
+            return
+        build_engine_defaults_card(self)
+
     def _apply_camoufox_defaults_to_form(self) -> None:
-        if self._camoufox_controls:
-            self._apply_camoufox_controls(self._camoufox_controls, self._active_browser_defaults())
+        if not self._camoufox_controls or not self._camoufox_form_dirty:
+            return
+        self._apply_camoufox_controls(self._camoufox_controls, self._active_browser_defaults())
+        self._camoufox_form_dirty = False
+
+    def _queue_settings_write(self, write: Callable[[], None], message: str = "") -> None:
+        def task() -> None:
+            try:
+                write()
+            except Exception:
+                LOGGER.exception("Failed to persist settings")
+                return
+            if message:
+                self._invoke_on_ui_thread(lambda: self.log(message))
+
+        self._settings_writer.start(task)
 
     def _handle_browser_engine_selection(self, engine: object) -> None:
         normalized = str(engine or "camoufox").strip().lower()
         if normalized not in {"camoufox", "cloakbrowser"}:
             normalized = "camoufox"
         self.browser_engine = normalized
-        db_set_browser_engine(normalized)
-        if self._camoufox_controls:
-            self._apply_camoufox_controls(self._camoufox_controls, self._active_browser_defaults())
+        self._queue_settings_write(lambda: db_set_browser_engine(normalized))
+        self._camoufox_form_dirty = True
+        self._apply_camoufox_defaults_to_form()
 
     def _save_camoufox_defaults(self) -> None:
         if not self._camoufox_controls:
             return
         values = self._collect_camoufox_controls(self._camoufox_controls)
         engine = str(values.get("browser_engine") or "camoufox")
-        db_set_browser_engine(engine)
         self.browser_engine = engine
         if engine == "cloakbrowser":
-            db_set_cloakbrowser_defaults(values)
-            self.cloakbrowser_defaults = db_get_cloakbrowser_defaults()
-            self.log("Saved CloakBrowser defaults")
+            base, store, label = CLOAKBROWSER_DEFAULTS, db_set_cloakbrowser_defaults, "CloakBrowser"
         else:
-            db_set_camoufox_defaults(values)
-            self.camoufox_defaults = db_get_camoufox_defaults()
-            self.log("Saved Camoufox defaults")
+            base, store, label = CAMOUFOX_DEFAULTS, db_set_camoufox_defaults, "Camoufox"
+        # Mirror what the db getter returns after a save: known keys only, defaults filled in.
+        merged = dict(base)
+        merged.update({key: values[key] for key in base if key in values})
+        if engine == "cloakbrowser":
+            self.cloakbrowser_defaults = merged
+        else:
+            self.camoufox_defaults = merged
+
+        def write() -> None:
+            db_set_browser_engine(engine)
+            store(values)
+
+        self._queue_settings_write(write, f"Saved {label} defaults")
+        self._camoufox_form_dirty = True
         self._apply_camoufox_defaults_to_form()
 
     def _reset_camoufox_defaults(self) -> None:
         if getattr(self, "browser_engine", "camoufox") == "cloakbrowser":
             self.cloakbrowser_defaults = dict(CLOAKBROWSER_DEFAULTS)
             defaults = dict(self.cloakbrowser_defaults)
-            db_set_cloakbrowser_defaults(defaults)
-            self.log("CloakBrowser defaults restored")
+            self._queue_settings_write(
+                lambda: db_set_cloakbrowser_defaults(defaults), "CloakBrowser defaults restored"
+            )
         else:
             self.camoufox_defaults = dict(CAMOUFOX_DEFAULTS)
             defaults = dict(self.camoufox_defaults)
-            db_set_camoufox_defaults(defaults)
-            self.log("Camoufox defaults restored")
-        defaults["browser_engine"] = self.browser_engine
-        if self._camoufox_controls:
-            self._apply_camoufox_controls(self._camoufox_controls, defaults)
+            self._queue_settings_write(lambda: db_set_camoufox_defaults(defaults), "Camoufox defaults restored")
+        self._camoufox_form_dirty = True
+        self._apply_camoufox_defaults_to_form()
 
     def _load_ui_theme_preference(self) -> str:
         theme_raw = db_get_setting("ui_theme")
@@ -1405,6 +1474,7 @@ class MainWindow(
         self.current_theme = normalized
         return normalized
 
+    @pyqtSlot(str)
     def _handle_theme_selection(self, value: Optional[str]) -> None:
         if value in (None, ""):
             return
@@ -1420,9 +1490,9 @@ class MainWindow(
             apply_modern_theme(app, normalized)
         if hasattr(self, "_refresh_log_colors"):
             self._refresh_log_colors()
-        db_set_setting("ui_theme", normalized)
+        self._queue_settings_write(lambda: db_set_setting("ui_theme", normalized))
         if self._theme_combo is not None:
-            idx = self._theme_combo.findData(normalized)
+            idx = self._theme_index.get(normalized, -1)
             if idx >= 0 and self._theme_combo.currentIndex() != idx:
                 self._theme_combo.blockSignals(True)
                 self._theme_combo.setCurrentIndex(idx)
@@ -1430,6 +1500,7 @@ class MainWindow(
         self.refresh_accounts_list()
         self.log(f"Theme switched to {normalized}")
 
+    @pyqtSlot(int)
     def _update_nav_state(self, index: int) -> None:
         for idx, btn in self._nav_buttons.items():
             btn.setChecked(idx == index)
@@ -1458,12 +1529,8 @@ class MainWindow(
         widget = getattr(self, "dashboard_activity_list", None)
         if widget is None:
             return
-        text = ""
-        log_edit = getattr(self, "log_edit", None)
-        if log_edit is not None:
-            text = log_edit.toPlainText()
         widget.clear()
-        lines = recent_log_lines(text, 7)
+        lines = recent_log_lines(self._log_plain_text(), 7)
         if not lines:
             widget.addItem("No activity yet")
             return
@@ -1481,15 +1548,23 @@ class MainWindow(
         tmpl = (value if value is not None else self.account_parse_template) or DEFAULT_ACCOUNT_TEMPLATE
         tmpl = tmpl.strip() or DEFAULT_ACCOUNT_TEMPLATE
         self.account_parse_template = tmpl
-        db_set_setting("account_parse_template", tmpl)
+        self._queue_settings_write(lambda: db_set_setting("account_parse_template", tmpl))
 
+    @pyqtSlot()
     def _expand_to_screen(self) -> None:
         self.showMaximized()
 
+    @pyqtSlot(int)
     def _on_tab_changed(self, index: int) -> None:
         self._update_nav_state(index)
+        if index == getattr(self, "_logs_tab_index", -1):
+            self._ensure_log_view()
+        if index == getattr(self, "_browser_tab_index", -1):
+            self._ensure_engine_defaults_card()
         if index == getattr(self, "_profiles_tab_index", -1):
-            self.refresh_accounts_list()
+            refreshed_at = getattr(self, "_accounts_refreshed_at", 0.0)
+            if time.monotonic() - refreshed_at >= _ACCOUNTS_REFRESH_INTERVAL_S:
+                self.refresh_accounts_list()
             self._load_shared_vars()
         if index == getattr(self, "_dashboard_tab_index", -1):
             self._refresh_dashboard()
@@ -2,20 +2,30 @@
 
 from __future__ import annotations
 
-import datetime
 import json
+import os
 import time
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-
-from PyQt6.QtCore import QFileSystemWatcher, Qt, QTimer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from PyQt6.QtCore import (
+    QAbstractListModel,
+    QFileSystemWatcher,
+    QModelIndex,
+    QRunnable,
+    Qt,
+    QThreadPool,
+    QTimer,
+    pyqtSignal,
+)
 from PyQt6.QtGui import QCloseEvent
 from PyQt6.QtWidgets import (
     QFrame,
     QHBoxLayout,
     QLabel,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QPushButton,
     QSpinBox,
     QVBoxLayout,
@@ -23,18 +33,157 @@ from PyQt6.QtWidgets import (
 )
 
 from app.services.scenario_debug import ScenarioDebugSession, ScenarioDebugUpdate
+from app.storage.db import db_get_scenario_path
+
+try:
+    # Pulled in by camoufox's fingerprint stack; parses bytes directly and much faster.
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# A change arriving after this much quiet time is reloaded on the next event-loop
+# pass; changes inside the window are coalesced (editors emit several per save).
+_RELOAD_IDLE_S = 1.0
+_RELOAD_COALESCE_MS = 150
+# A file whose size/mtime moves between two stats this far apart is still being
+# written; it is retried after _RELOAD_RETRY_MS instead of parsing partial content.
+_STABLE_CHECK_S = 0.01
+_RELOAD_RETRY_MS = 100
+
+
+@lru_cache(maxsize=256)
+def _fmt_ts_int(ts: int) -> str:
+    try:
+        return time.strftime("%H:%M:%S", time.localtime(ts))
+    except Exception:
+        return "-"
 
 
 def _fmt_ts(ts: Optional[float]) -> str:
     if not ts:
         return "-"
     try:
-        return datetime.datetime.fromtimestamp(float(ts)).strftime("%H:%M:%S")
+        return _fmt_ts_int(int(ts))
     except Exception:
         return "-"
 
 
+StatKey = Tuple[str, int, int]
+
+
+@dataclass(frozen=True)
+class _StepsSnapshot:
+    """Result of reading a scenario file; ``stat_key`` is None when the file is missing."""
+
+    generation: int
+    stat_key: Optional[StatKey]
+    steps: list
+    ordered: List[int]
+    stable: bool = True
+
+
+class _StepsLoader(QRunnable):
+    """Reads, parses and orders scenario steps on a pool thread."""
+
+    def __init__(
+        self,
+        path: Path,
+        last_stat_key: Optional[StatKey],
+        generation: int,
+        deliver: Callable[[_StepsSnapshot], None],
+    ) -> None:
+        super().__init__()
+        self._path = path
+        self._last_stat_key = last_stat_key
+        self._generation = generation
+        self._deliver = deliver
+
+    def run(self) -> None:
+        try:
+            snapshot = self._load()
+        except Exception:
+            return
+        if snapshot is None:
+            return
+        try:
+            self._deliver(snapshot)
+        except RuntimeError:
+            # The debugger window was destroyed while the file was being read.
+            pass
+
+    def _load(self) -> Optional[_StepsSnapshot]:
+        path = str(self._path)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return _StepsSnapshot(self._generation, None, [], [])
+        stat_key = (path, st.st_mtime_ns, st.st_size)
+        if stat_key == self._last_stat_key:
+            return None
+        time.sleep(_STABLE_CHECK_S)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return _StepsSnapshot(self._generation, None, [], [])
+        if (path, st.st_mtime_ns, st.st_size) != stat_key:
+            return _StepsSnapshot(self._generation, stat_key, [], [], stable=False)
+        with open(path, "rb") as fh:
+            payload = _json_loads(fh.read())
+        steps = payload.get("steps") or []
+        if not isinstance(steps, list):
+            return None
+        ordered = ScenarioDebuggerWindow._order_steps_for_display(steps)
+        return _StepsSnapshot(self._generation, stat_key, steps, ordered)
+
+
+class _StepsModel(QAbstractListModel):
+    """Flat list model for the debugger steps: display text plus original step index."""
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._texts: List[str] = []
+        self._origs: List[int] = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
+        if parent.isValid():
+            return 0
+        return len(self._texts)
+
+    def data(self, index: QModelIndex, role: int = int(Qt.ItemDataRole.DisplayRole)) -> Any:
+        row = index.row()
+        if not index.isValid() or row < 0 or row >= len(self._texts):
+            return None
+        if role == int(Qt.ItemDataRole.DisplayRole):
+            return self._texts[row]
+        if role == int(Qt.ItemDataRole.UserRole):
+            return self._origs[row]
+        return None
+
+    def set_rows(self, rows: List[Tuple[int, str]]) -> None:
+        """
+        Swap in new rows. Same-length updates only signal the changed span so the
+        view keeps its selection; anything else is a single model reset.
+        """
+        texts = [text for _, text in rows]
+        origs = [int(original_idx) for original_idx, _ in rows]
+        if len(texts) != len(self._texts):
+            self.beginResetModel()
+            self._texts, self._origs = texts, origs
+            self.endResetModel()
+            return
+        changed = [
+            row
+            for row in range(len(texts))
+            if texts[row] != self._texts[row] or origs[row] != self._origs[row]
+        ]
+        self._texts, self._origs = texts, origs
+        if changed:
+            self.dataChanged.emit(self.index(changed[0]), self.index(changed[-1]))
+
+
 class ScenarioDebuggerWindow(QWidget):
+    _steps_loaded = pyqtSignal(object)
+
     def __init__(
         self,
         session: ScenarioDebugSession,
@@ -47,15 +196,31 @@ class ScenarioDebuggerWindow(QWidget):
         self._scenario_path = scenario_path
         self._scenario_name: str = ""
         self._last_update: Optional[ScenarioDebugUpdate] = None
+        # (update, paused, steps file key) last rendered by apply_update.
+        self._last_update_key: Optional[tuple] = None
         self._watcher: Optional[QFileSystemWatcher] = None
         self._reload_timer: Optional[QTimer] = None
+        self._immediate_reload_timer: Optional[QTimer] = None
+        self._last_reload_ts: float = 0.0
         self._steps_loaded_at: Optional[float] = None
+        # (path, mtime_ns, size) of the scenario file last rendered into the steps list.
+        self._last_stat_key: Optional[StatKey] = None
+        self._reload_generation = 0
+        # Original step index per displayed row; row <-> step lookups never touch the view.
+        self._ordered_indices: List[int] = []
+        self._row_by_step_index: Dict[int, int] = {}
+        # Row text without the order prefix, keyed by (action, tag, description); only
+        # entries for the currently loaded steps are kept.
+        self._row_body_cache: Dict[Tuple[str, str, str], str] = {}
+        # Set while apply_update moves the current row; the list -> spin sync skips it.
+        self._syncing_from_update = False
         self.setWindowTitle("Scenario debugger")
         # Separate, non-modal top-level window (independent from the main window).
         self.setWindowModality(Qt.WindowModality.NonModal)
         self.setWindowFlags(Qt.WindowType.Window)
         self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose, True)
         self.setMinimumWidth(520)
+        self._steps_loaded.connect(self._apply_loaded_steps)
 
         root = QVBoxLayout(self)
         root.setContentsMargins(16, 16, 16, 16)
@@ -114,6 +279,8 @@ class ScenarioDebuggerWindow(QWidget):
         jump_row.addWidget(QLabel("Run from step:", jump))
         self._step_spin = QSpinBox(jump)
         self._step_spin.setRange(1, 999999)
+        # Maximum last pushed by apply_update; only code ever changes it.
+        self._spin_max = 999999
         self._step_spin.setValue(1)
         jump_row.addWidget(self._step_spin)
         self._run_step_btn = QPushButton("Run", jump)
@@ -123,13 +290,18 @@ class ScenarioDebuggerWindow(QWidget):
         jump_layout.addLayout(jump_row)
 
         steps_title = QLabel("Steps (auto reload):", jump)
-        steps_title.setProperty("class", "cardTitle")
+        steps_title.setObjectName("cardTitle")
         jump_layout.addWidget(steps_title)
 
-        self._steps_list = QListWidget(jump)
+        self._steps_model = _StepsModel(self)
+        self._steps_list = QListView(jump)
+        self._steps_list.setModel(self._steps_model)
+        self._steps_list.setUniformItemSizes(True)
         self._steps_list.setMinimumHeight(220)
-        self._steps_list.currentRowChanged.connect(self._sync_spin_from_list)
-        self._steps_list.itemDoubleClicked.connect(lambda _: self._run_selected_step())
+        self._steps_list.selectionModel().currentRowChanged.connect(
+            lambda current, _previous: self._sync_spin_from_list(current.row())
+        )
+        self._steps_list.doubleClicked.connect(lambda _: self._run_selected_step())
         jump_layout.addWidget(self._steps_list, 1)
 
         run_sel_row = QHBoxLayout()
@@ -145,12 +317,13 @@ class ScenarioDebuggerWindow(QWidget):
         self._setup_step_watcher()
 
     def apply_update(self, update: ScenarioDebugUpdate) -> None:
+        key = (update, self._session.paused, self._last_stat_key)
+        if key == self._last_update_key:
+            return
         self._last_update = update
         if update.scenario_name and update.scenario_name != self._scenario_name:
             self._scenario_name = update.scenario_name
             try:
-                from app.storage.db import db_get_scenario_path
-
                 self._set_scenario_path(db_get_scenario_path(update.scenario_name))
             except Exception:
                 pass
@@ -161,7 +334,7 @@ class ScenarioDebuggerWindow(QWidget):
         tag = (update.tag or "").strip() or "-"
         action = (update.action or "").strip() or "-"
         order_row = self._row_for_step_index(int(update.step_index))
-        order_total = self._steps_list.count()
+        order_total = self._steps_model.rowCount()
         if order_row is not None:
             self._step_label.setText(
                 f"Order: {order_row + 1}/{max(1, order_total)} (step #{step_no}/{total}, tag: {tag}, action: {action})"
@@ -170,25 +343,30 @@ class ScenarioDebuggerWindow(QWidget):
             self._step_label.setText(f"Step #: {step_no}/{total} (tag: {tag}, action: {action})")
         self._desc_label.setText(f"Description: {update.description or update.tag or update.action or '-'}")
         self._reload_label.setText(f"Hot reload: last reload {_fmt_ts(update.reloaded_at)}")
-        self._step_spin.setMaximum(max(1, max(1, self._steps_list.count())))
-        try:
-            self._step_spin.blockSignals(True)
-            if order_row is not None:
-                self._step_spin.setValue(max(1, min(order_row + 1, self._step_spin.maximum())))
-            else:
-                self._step_spin.setValue(max(1, min(step_no, self._step_spin.maximum())))
-        finally:
-            self._step_spin.blockSignals(False)
-        try:
-            self._steps_list.blockSignals(True)
-            if order_row is not None:
-                self._steps_list.setCurrentRow(order_row)
-        finally:
-            self._steps_list.blockSignals(False)
+        spin_max = max(1, order_total)
+        if spin_max != self._spin_max:
+            self._step_spin.setMaximum(spin_max)
+            self._spin_max = spin_max
+        spin_value = max(1, min(order_row + 1 if order_row is not None else step_no, spin_max))
+        if self._step_spin.value() != spin_value:
+            try:
+                self._step_spin.blockSignals(True)
+                self._step_spin.setValue(spin_value)
+            finally:
+                self._step_spin.blockSignals(False)
+        if order_row is not None and self._steps_list.currentIndex().row() != order_row:
+            # the view itself listens to the selection model, so only our own sync is muted
+            self._syncing_from_update = True
+            try:
+                self._set_current_row(order_row)
+            finally:
+                self._syncing_from_update = False
         self._refresh_steps_status(total)
         self._refresh_pause_button()
+        self._last_update_key = (update, self._session.paused, self._last_stat_key)
 
     def mark_finished(self, *, stopped: bool = False) -> None:
+        self._last_update_key = None
         update = self._last_update
         if update is not None:
             step_no = int(update.step_index) + 1
@@ -233,7 +411,7 @@ class ScenarioDebuggerWindow(QWidget):
         self._refresh_pause_button()
 
     def _sync_spin_from_list(self, row: int) -> None:
-        if row < 0:
+        if row < 0 or self._syncing_from_update:
             return
         try:
             self._step_spin.setValue(int(row) + 1)
@@ -241,7 +419,7 @@ class ScenarioDebuggerWindow(QWidget):
             pass
 
     def _run_selected_step(self) -> None:
-        row = self._steps_list.currentRow()
+        row = self._steps_list.currentIndex().row()
         if row < 0:
             return
         actual = self._step_index_for_row(row)
@@ -264,16 +442,17 @@ class ScenarioDebuggerWindow(QWidget):
 
         self._watcher = QFileSystemWatcher(self)
         self._watcher.fileChanged.connect(lambda _: self._schedule_steps_reload())
-        self._watcher.directoryChanged.connect(lambda _: self._schedule_steps_reload())
-        try:
-            self._watcher.addPath(str(self._scenario_path.parent))
-        except Exception:
-            pass
+        self._watcher.directoryChanged.connect(self._on_scenario_dir_changed)
         self._ensure_watched_file()
 
         self._reload_timer = QTimer(self)
         self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(_RELOAD_COALESCE_MS)
         self._reload_timer.timeout.connect(self._reload_steps_from_disk)
+        self._immediate_reload_timer = QTimer(self)
+        self._immediate_reload_timer.setSingleShot(True)
+        self._immediate_reload_timer.setInterval(0)
+        self._immediate_reload_timer.timeout.connect(self._reload_steps_from_disk)
         self._reload_steps_from_disk()
 
     def _set_scenario_path(self, path: Path) -> None:
@@ -291,75 +470,129 @@ class ScenarioDebuggerWindow(QWidget):
                 self._watcher.removePaths(self._watcher.directories())
             except Exception:
                 pass
-            try:
-                self._watcher.addPath(str(self._scenario_path.parent))
-            except Exception:
-                pass
             self._ensure_watched_file()
         self._reload_steps_from_disk()
 
-    def _ensure_watched_file(self) -> None:
+    def _ensure_watched_file(self) -> bool:
+        """
+        Watch the scenario file itself; the parent directory is only watched while
+        the file is missing (e.g. mid atomic-rename save) so it can be picked up again.
+        Returns whether the scenario file currently exists.
+        """
         if not self._watcher or not self._scenario_path:
-            return
+            return False
         file_path = str(self._scenario_path)
-        if file_path in set(self._watcher.files()):
-            return
-        if self._scenario_path.exists():
+        dir_path = str(self._scenario_path.parent)
+        try:
+            os.stat(file_path)
+            exists = True
+        except OSError:
+            exists = False
+        watched_dirs = self._watcher.directories()
+        if exists:
+            if file_path not in self._watcher.files():
+                try:
+                    self._watcher.addPath(file_path)
+                except Exception:
+                    pass
+            if dir_path in watched_dirs:
+                self._watcher.removePath(dir_path)
+        elif dir_path not in watched_dirs:
             try:
-                self._watcher.addPath(file_path)
+                self._watcher.addPath(dir_path)
             except Exception:
                 pass
+        return exists
+
+    def _on_scenario_dir_changed(self, _path: str) -> None:
+        if self._ensure_watched_file():
+            self._queue_steps_reload()
 
     def _schedule_steps_reload(self) -> None:
         self._ensure_watched_file()
-        if self._reload_timer:
-            self._reload_timer.start(200)
+        self._queue_steps_reload()
+
+    def _queue_steps_reload(self) -> None:
+        if not self._reload_timer or not self._immediate_reload_timer:
+            return
+        idle = time.monotonic() - self._last_reload_ts >= _RELOAD_IDLE_S
+        if idle and not self._reload_timer.isActive():
+            self._immediate_reload_timer.start()
+        else:
+            self._reload_timer.start(_RELOAD_COALESCE_MS)
 
     def _reload_steps_from_disk(self) -> None:
-        self._ensure_watched_file()
+        self._last_reload_ts = time.monotonic()
         if not self._scenario_path:
             return
-        if not self._scenario_path.exists():
-            self._steps_list.clear()
-            self._steps_loaded_at = None
-            self._refresh_steps_status(0)
+        self._reload_generation += 1
+        loader = _StepsLoader(
+            self._scenario_path,
+            self._last_stat_key,
+            self._reload_generation,
+            self._steps_loaded.emit,
+        )
+        QThreadPool.globalInstance().start(loader)
+
+    def _apply_loaded_steps(self, snapshot: _StepsSnapshot) -> None:
+        if snapshot.generation != self._reload_generation:
             return
-        try:
-            payload = json.loads(self._scenario_path.read_text(encoding="utf-8"))
-        except Exception:
+        if not snapshot.stable:
+            if self._reload_timer is not None:
+                self._reload_timer.start(_RELOAD_RETRY_MS)
             return
-        steps = payload.get("steps") or []
-        if not isinstance(steps, list):
+        if snapshot.stat_key is None:
+            self._steps_model.set_rows([])
+            self._steps_loaded_at = None
+            self._last_stat_key = None
+            self._ordered_indices = []
+            self._row_by_step_index = {}
+            self._row_body_cache = {}
+            self._refresh_steps_status(0)
             return
 
-        ordered = self._order_steps_for_display(steps)
-        prev_row = self._steps_list.currentRow()
-        self._steps_list.blockSignals(True)
-        self._steps_list.clear()
+        steps = snapshot.steps
+        ordered = snapshot.ordered
+        self._last_stat_key = snapshot.stat_key
+        self._ordered_indices = ordered
+        self._row_by_step_index = {original_idx: row for row, original_idx in enumerate(ordered)}
+        rows: List[Tuple[int, str]] = []
+        body_cache = self._row_body_cache
+        bodies: Dict[Tuple[str, str, str], str] = {}
         for order_idx, original_idx in enumerate(ordered):
             step = steps[original_idx] if 0 <= original_idx < len(steps) else {}
             step_dict = step if isinstance(step, dict) else {}
             action = str(step_dict.get("action") or "")
             tag = str(step_dict.get("tag") or step_dict.get("label") or "")
             desc = str(step_dict.get("description") or tag or action or "")
-            suffix = f" ({tag})" if tag and tag != desc else ""
-            text = f"{order_idx + 1:03d}: {action or '-'} - {desc}{suffix}"
-            item = QListWidgetItem(text, self._steps_list)
-            item.setData(Qt.ItemDataRole.UserRole, int(original_idx))
-        self._steps_list.blockSignals(False)
+            key = (action, tag, desc)
+            body = body_cache.get(key)
+            if body is None:
+                suffix = f" ({tag})" if tag and tag != desc else ""
+                body = f"{action or '-'} - {desc}{suffix}"
+            bodies[key] = body
+            rows.append((int(original_idx), f"{order_idx + 1:03d}: {body}"))
+        self._row_body_cache = bodies
+
+        prev_row = self._steps_list.currentIndex().row()
+        self._steps_model.set_rows(rows)
         # Restore selection to the same underlying step index when possible.
+        total = self._steps_model.rowCount()
         restored = None
         if self._last_update is not None:
             restored = self._row_for_step_index(int(self._last_update.step_index))
         if restored is not None:
-            self._steps_list.setCurrentRow(restored)
-        elif prev_row >= 0 and prev_row < self._steps_list.count():
-            self._steps_list.setCurrentRow(prev_row)
-        elif self._steps_list.count() > 0:
-            self._steps_list.setCurrentRow(0)
+            self._set_current_row(restored)
+        elif prev_row >= 0 and prev_row < total:
+            self._set_current_row(prev_row)
+        elif total > 0:
+            self._set_current_row(0)
 
         self._steps_loaded_at = time.time()
-        self._refresh_steps_status(self._steps_list.count())
+        self._refresh_steps_status(total)
+
+    def _set_current_row(self, row: int) -> None:
+        self._steps_list.setCurrentIndex(self._steps_model.index(row))
 
     def _refresh_steps_status(self, total_steps: int) -> None:
         if self._scenario_path:
@@ -370,26 +603,16 @@ class ScenarioDebuggerWindow(QWidget):
         self._steps_label.setText(f"Steps: {int(total_steps)} (file: {name}, loaded {loaded})")
 
     def _step_index_for_row(self, row: int) -> Optional[int]:
-        if row < 0 or row >= self._steps_list.count():
-            return None
-        item = self._steps_list.item(row)
-        if item is None:
-            return None
-        try:
-            value = item.data(Qt.ItemDataRole.UserRole)
-            return int(value)
-        except Exception:
-            return None
+        if 0 <= row < len(self._ordered_indices):
+            return self._ordered_indices[row]
+        return None
 
     def _row_for_step_index(self, step_index: int) -> Optional[int]:
         try:
             idx = int(step_index)
         except Exception:
             return None
-        for row in range(self._steps_list.count()):
-            if self._step_index_for_row(row) == idx:
-                return row
-        return None
+        return self._row_by_step_index.get(idx)
 
     @staticmethod
     def _order_steps_for_display(steps: list) -> list[int]:
@@ -402,42 +625,66 @@ class ScenarioDebuggerWindow(QWidget):
         """
         if not steps:
             return []
+        # Flatten the fields the walk needs into parallel lists in a single pass.
+        count = len(steps)
         tag_index: dict[str, int] = {}
+        next_tags: list[Optional[str]] = [None] * count
+        no_default: list[bool] = [False] * count
+        start = -1
         for i, step in enumerate(steps):
-            if isinstance(step, dict) and step.get("tag"):
-                tag_index[str(step.get("tag"))] = i
-
-        start = 0
-        for i, step in enumerate(steps):
-            if isinstance(step, dict) and str(step.get("action") or "").lower() == "start":
+            if not isinstance(step, dict):
+                continue
+            tag = step.get("tag")
+            if tag:
+                tag_index[str(tag)] = i
+            if start < 0 and str(step.get("action") or "").lower() == "start":
                 start = i
-                break
+            next_tag = step.get("next_success_step")
+            if next_tag:
+                next_tags[i] = str(next_tag)
+            if step.get("_no_default_links"):
+                no_default[i] = True
+        next_index = [-1 if tag is None else tag_index.get(tag, -1) for tag in next_tags]
 
         order: list[int] = []
-        visited: set[int] = set()
-        idx = start
-        while 0 <= idx < len(steps) and idx not in visited:
-            visited.add(idx)
+        visited = [False] * count
+        idx = max(start, 0)
+        while 0 <= idx < count and not visited[idx]:
+            visited[idx] = True
             order.append(idx)
-            step = steps[idx] if isinstance(steps[idx], dict) else {}
-            next_tag = step.get("next_success_step")
-            if next_tag and str(next_tag) in tag_index:
-                nxt = int(tag_index[str(next_tag)])
-                if nxt not in visited:
-                    idx = nxt
-                    continue
-            if step.get("_no_default_links"):
+            nxt = next_index[idx]
+            if nxt >= 0 and not visited[nxt]:
+                idx = nxt
+                continue
+            if no_default[idx]:
                 break
-            idx = idx + 1
+            idx += 1
 
-        for i in range(len(steps)):
-            if i not in visited:
-                order.append(i)
+        order.extend(i for i in range(count) if not visited[i])
         return order
 
+    def _teardown_step_watcher(self) -> None:
+        # Drop pending reloads and inotify watches now rather than at deferred deletion.
+        self._reload_generation += 1
+        for timer in (self._reload_timer, self._immediate_reload_timer):
+            if timer is not None:
+                timer.stop()
+                timer.deleteLater()
+        self._reload_timer = None
+        self._immediate_reload_timer = None
+        watcher = self._watcher
+        self._watcher = None
+        if watcher is not None:
+            watcher.blockSignals(True)
+            paths = watcher.files() + watcher.directories()
+            if paths:
+                watcher.removePaths(paths)
+            watcher.deleteLater()
+
     def closeEvent(self, event: QCloseEvent) -> None:
         try:
             self._session.disable()
         except Exception:
             pass
+        self._teardown_step_watcher()
         super().closeEvent(event)
@@ -1,10 +1,52 @@
-import math
-from typing import Dict, List, Optional, Set, Tuple
-
-from PyQt6.QtCore import QPointF, Qt
-from PyQt6.QtGui import QColor, QContextMenuEvent, QFont, QPainter, QPen
+from functools import lru_cache
+from math import ceil
+from typing import Dict, List, Mapping, Optional, Set, Tuple
+
+from PyQt6.QtCore import QPointF, QRect, QRectF, Qt, QTimer
+from PyQt6.QtGui import (
+    QColor,
+    QContextMenuEvent,
+    QFont,
+    QFontMetrics,
+    QPainter,
+    QPainterPath,
+    QPen,
+    QPixmap,
+    QPolygonF,
+    QRegion,
+)
 from PyQt6.QtWidgets import QMenu, QWidget
 
+# Pointer-driven repaints (drag, pan, wheel) are coalesced to roughly one per display frame.
+_REDRAW_INTERVAL_MS = 16
+_OK_LINK_COLOR = "#8b5cf6"
+_ERR_LINK_COLOR = "#ef4444"
+
+# Fixed paint state shared by every frame, so paintEvent does not rebuild it per repaint.
+_BACKGROUND_COLOR = QColor("#1a1a2e")
+_EMPTY_TEXT_PEN = QPen(QColor("#888888"), 1)
+_GRID_PEN = QPen(QColor(255, 255, 255, 18), 1)
+_SELECTED_PEN = QPen(QColor("#a78bfa"), 2)
+_INPUT_DOT_PEN = QPen(QColor("#a78bfa"), 8, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap)
+_OUTPUT_DOT_PEN = QPen(QColor(_OK_LINK_COLOR), 12, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap)
+
+
+@lru_cache(maxsize=8)
+def _link_pen(color: str) -> QPen:
+    """Dashed pen for links of one colour; built once and reused by every frame."""
+    pen = QPen(QColor(color), 2)
+    pen.setStyle(Qt.PenStyle.DashLine)
+    pen.setDashPattern([4, 5])
+    return pen
+
+
+# A painted link for hit testing and culling:
+# (src, dst, kind, ax, ay, bx - ax, by - ay, 1 / |ab|^2, left, top, right, bottom).
+_LinkSegment = Tuple[int, int, str, float, float, float, float, float, float, float, float, float]
+
+# Node pixmaps extend this far past the node rect so the antialiased border is not cut off.
+_NODE_PIXMAP_PAD = 2
+
 
 class ScenarioEditor(QWidget):
     """Simple node/arrow map renderer for scenario steps using QPainter."""
@@ -17,6 +59,9 @@ class ScenarioEditor(QWidget):
         self.selected_idx: int = -1
         self.custom_positions: Dict[int, QPointF] = {}
         self.setMinimumHeight(200)
+        # paintEvent fills every damaged pixel itself, so Qt can skip erasing the background.
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
         self.node_w = 220
         self.node_h = 76
         self.v_gap = 52
@@ -44,9 +89,28 @@ class ScenarioEditor(QWidget):
         self._linking_from: Optional[int] = None
         self._linking_kind: Optional[str] = None  # "ok" | "err"
         self._linking_pos: Optional[QPointF] = None
+        # Offset-free node rects from the last paint; add self.offset for view coordinates.
         self._last_positions: Dict[int, Tuple[float, float, float, float]] = {}
+        self._link_segments: List[_LinkSegment] = []
         self._row_map: Dict[int, int] = {}
-        self.action_labels: Dict[str, str] = {}
+        # Offset-free top-left corner per step and the geometry derived from it;
+        # both are rebuilt lazily after _invalidate_layout (None = stale).
+        self._base_positions: Optional[List[Tuple[float, float]]] = None
+        self._scene_geometry_cache: Optional[tuple] = None
+        # Step indices bucketed by the grid cell of their offset-free top-left corner.
+        self._hit_grid: Optional[Dict[Tuple[int, int], List[int]]] = None
+        self._hit_grid_cell = float(max(self.node_w, self.node_h) + self.h_gap)
+        # Number of error links pointing at each step; such steps sit in the lower row.
+        self._err_in_degree: Dict[int, int] = {}
+        self.action_labels: Mapping[str, str] = {}
+        # Rendered node bodies keyed by their visible content; all entries share one scale.
+        self._node_pixmap_cache: Dict[Tuple, QPixmap] = {}
+        self._node_pixmap_scale = 0.0
+        self._pending_redraw = QRegion()
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(_REDRAW_INTERVAL_MS)
+        self._redraw_timer.timeout.connect(self._flush_redraw)
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
 
     def set_steps(self, steps: List[Dict]) -> None:
@@ -57,6 +121,8 @@ class ScenarioEditor(QWidget):
         self.ok_links = {}
         self.err_links = {}
         self._row_map = {}
+        self._node_pixmap_cache = {}
+        self._invalidate_layout()
         for idx, step in enumerate(self.steps):
             label = step.get("label")
             if label:
@@ -95,21 +161,21 @@ class ScenarioEditor(QWidget):
 
             self.ok_links[idx] = ok_set
             self.err_links[idx] = err_set
-        # place nodes primarily in one row, error targets slightly lower at same x
-        self._row_map = {idx: 0 for idx in range(len(self.steps))}
-        for src, targets in self.err_links.items():
+        self._err_in_degree = {idx: 0 for idx in range(len(self.steps))}
+        for targets in self.err_links.values():
             for t in targets:
-                if t == src:
-                    continue
-                self._row_map[t] = 1
+                self._err_in_degree[t] += 1
+        # place nodes primarily in one row, error targets slightly lower at same x
+        self._row_map = {idx: 1 if count else 0 for idx, count in self._err_in_degree.items()}
         self.update()
 
     def set_selected(self, idx: int) -> None:
         self.selected_idx = idx
         self.update()
 
-    def set_action_labels(self, mapping: Optional[Dict[str, str]]) -> None:
+    def set_action_labels(self, mapping: Optional[Mapping[str, str]]) -> None:
         self.action_labels = mapping or {}
+        self._node_pixmap_cache = {}
         self.update()
 
     def _scene_pos_from_view(self, view_point: QPointF) -> QPointF:
@@ -161,152 +227,342 @@ class ScenarioEditor(QWidget):
     def focus_on_start(self) -> None:
         self.focus_on_tag("Start")
 
+    def _scene_node_rect(self, idx: int) -> Tuple[float, float, float, float]:
+        """Offset-free (x, y, w, h) of a node; panning never changes it."""
+        base = self._base_position(idx)
+        bx, by = base if base is not None else (0.0, 0.0)
+        return bx, by, self.node_w, self.node_h
+
     def _node_rect(self, idx: int):
-        row = self._row_map.get(idx, 0)
-        base_x = self.h_gap + idx * (self.node_w + self.h_gap)
-        base_y = self.v_gap + (row * (self.node_h + self.v_gap))
-        if idx in self.custom_positions:
-            base = self.custom_positions[idx]
-            base_x = base.x()
-            base_y = base.y()
-        x = base_x + self.offset.x()
-        y = base_y + self.offset.y()
-        return x, y, self.node_w, self.node_h
-
-    def _draw_arrow(self, painter: QPainter, start: QPointF, end: QPointF, color: QColor) -> None:
-        pen = QPen(color, 2)
-        pen.setStyle(Qt.PenStyle.DashLine)
-        pen.setDashPattern([4, 5])
-        painter.setPen(pen)
+        x, y, w, h = self._scene_node_rect(idx)
+        return x + self.offset.x(), y + self.offset.y(), w, h
+
+    def _invalidate_layout(self) -> None:
+        """Forget cached node positions, links geometry and hit grid after a layout change."""
+        self._base_positions = None
+        self._scene_geometry_cache = None
+        self._hit_grid = None
+
+    def _layout_positions(self) -> List[Tuple[float, float]]:
+        positions = self._base_positions
+        if positions is None:
+            positions = []
+            for idx in range(len(self.steps)):
+                base = self._base_position(idx)
+                positions.append(base if base is not None else (0.0, 0.0))
+            self._base_positions = positions
+        return positions
+
+    def _scene_geometry(self) -> tuple:
+        """
+        Return offset-free (positions, in_pts, out_pts, segments).
+
+        The geometry does not depend on the pan offset, so it is reused until the layout
+        changes; paintEvent and the hit tests apply the offset themselves.
+        """
+        cached = self._scene_geometry_cache
+        if cached is not None:
+            return cached
+        w, h = self.node_w, self.node_h
+        positions: Dict[int, Tuple[float, float, float, float]] = {}
+        # Connector centres per step; ok and err links leave from the same output point.
+        in_pts: List[QPointF] = []
+        out_pts: List[QPointF] = []
+        # Bound once: these run per node and per link on every layout or pan change.
+        add_in, add_out = in_pts.append, out_pts.append
+        for idx, (x, y) in enumerate(self._layout_positions()):
+            positions[idx] = (x, y, w, h)
+            mid_y = y + h * 0.5
+            add_in(QPointF(x - 12, mid_y))
+            add_out(QPointF(x + w + 14, mid_y))
+        segments: List[_LinkSegment] = []
+        add_segment = segments.append
+        for links, kind in ((self.ok_links, "ok"), (self.err_links, "err")):
+            for src, targets in links.items():
+                if src not in positions:
+                    continue
+                start_pt = out_pts[src]
+                ax, ay = start_pt.x(), start_pt.y()
+                for dst in targets:
+                    if dst not in positions:
+                        continue
+                    input_pt = in_pts[dst]
+                    bx, by = input_pt.x(), input_pt.y()
+                    abx, aby = bx - ax, by - ay
+                    len_sq = abx * abx + aby * aby
+                    add_segment(
+                        (
+                            src,
+                            dst,
+                            kind,
+                            ax,
+                            ay,
+                            abx,
+                            aby,
+                            1.0 / len_sq if len_sq else 0.0,
+                            min(ax, bx),
+                            min(ay, by),
+                            max(ax, bx),
+                            max(ay, by),
+                        )
+                    )
+        geometry = (positions, in_pts, out_pts, segments)
+        self._scene_geometry_cache = geometry
+        return geometry
+
+    @staticmethod
+    def _node_paint_bounds(rect: Tuple[float, float, float, float]) -> QRectF:
+        """Scene-space area a node paints into, including its connectors and selection outline."""
+        x, y, w, h = rect
+        return QRectF(x - 16, y - 4, w + 36, h + 8)
+
+    def _node_neighbours(self, idx: int) -> Set[int]:
+        neighbours: Set[int] = set()
+        for links in (self.ok_links, self.err_links):
+            neighbours.update(links.get(idx, ()))
+            for src, targets in links.items():
+                if idx in targets:
+                    neighbours.add(src)
+        neighbours.discard(idx)
+        return neighbours
+
+    def _schedule_redraw(self, rect: Optional[QRect] = None) -> None:
+        """Queue a repaint of ``rect`` (or the whole widget) for the next coalesced flush."""
+        self._pending_redraw = self._pending_redraw.united(rect if rect is not None else self.rect())
+        if not self._redraw_timer.isActive():
+            self._redraw_timer.start()
+
+    def _flush_redraw(self) -> None:
+        if not self._pending_redraw.isEmpty():
+            self.update(self._pending_redraw)
+        self._pending_redraw = QRegion()
+
+    def _update_scene_rect(self, rect: QRectF) -> None:
+        """Schedule a repaint of a scene-space rect (pre-zoom), padded for pens and antialiasing."""
+        zoom = self.zoom
+        view = QRectF(rect.x() * zoom, rect.y() * zoom, rect.width() * zoom, rect.height() * zoom)
+        self._schedule_redraw(view.adjusted(-16, -16, 16, 16).toAlignedRect())
+
+    def _update_dragged_node(self, idx: int, old_rect: Optional[Tuple[float, float, float, float]]) -> None:
+        """Repaint a moved node; ``old_rect`` is its last painted offset-free rect."""
+        if old_rect is None:
+            self._schedule_redraw()
+            return
+        new_rect = self._scene_node_rect(idx)
+        dirty = self._node_paint_bounds(old_rect).united(self._node_paint_bounds(new_rect))
+        # Arrows to and from the node span from its connectors to the neighbours' ones.
+        for other in self._node_neighbours(idx):
+            dirty = dirty.united(self._node_paint_bounds(self._scene_node_rect(other)))
+        self._update_scene_rect(dirty.translated(self.offset))
+
+    def _node_pixmap(self, idx: int, step: Dict, w: float, h: float, scale: float) -> QPixmap:
+        if scale != self._node_pixmap_scale:
+            self._node_pixmap_cache = {}
+            self._node_pixmap_scale = scale
+        is_start = str(step.get("action", "")).lower() == "start"
+        action = step.get("action", "")
+        action_label = self.action_labels.get(str(action), action)
+        selector = step.get("selector") or step.get("value") or step.get("url") or ""
+        if step.get("selector") and step.get("selector_type"):
+            selector = f"[{step.get('selector_type')}] {step.get('selector')}"
+        key = (idx, is_start, str(action_label), str(selector), w, h)
+        pixmap = self._node_pixmap_cache.get(key)
+        if pixmap is None:
+            pixmap = self._render_node_pixmap(idx, is_start, str(action_label), str(selector), w, h, scale)
+            self._node_pixmap_cache[key] = pixmap
+        return pixmap
+
+    def _render_node_pixmap(
+        self, idx: int, is_start: bool, action_label: str, selector: str, w: float, h: float, scale: float
+    ) -> QPixmap:
+        """Paint a node body into a pixmap padded by _NODE_PIXMAP_PAD on every side."""
+        pad = _NODE_PIXMAP_PAD
+        pixmap = QPixmap(ceil((w + 2 * pad) * scale), ceil((h + 2 * pad) * scale))
+        pixmap.setDevicePixelRatio(scale)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        try:
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            x, y = pad, pad
+            text_color = QColor("#e8e8f0")
+            muted_color = QColor("#b0b0c8")
+            painter.setBrush(QColor(6, 182, 212, 45) if is_start else QColor(22, 22, 42, 215))
+            painter.setPen(QPen(QColor("#06b6d4") if is_start else QColor(255, 255, 255, 32), 2 if is_start else 1))
+            painter.drawRoundedRect(int(x), int(y), int(w), int(h), 10, 10)
+
+            # Text is elided with the metrics of the font it is drawn in, so it stays inside
+            # the node without a clip rect (one spare pixel absorbs rounding).
+            available = max(0, int(w) - 25)
+            step_text = f"Step {idx + 1}."
+            painter.setPen(QPen(QColor("#06b6d4") if is_start else QColor("#8b5cf6"), 1))
+            painter.setFont(QFont("Segoe UI", 8, QFont.Weight.DemiBold))
+            painter.drawText(int(x + 18), int(y + 22), step_text)
+            painter.setPen(QPen(text_color, 1))
+            header_font = QFont("Segoe UI", 9, QFont.Weight.DemiBold)
+            painter.setFont(header_font)
+            header = QFontMetrics(header_font).elidedText(action_label, Qt.TextElideMode.ElideRight, available)
+            painter.drawText(int(x + 18), int(y + 46), header)
+            if selector:
+                selector_font = QFont("Consolas", 8)
+                painter.setFont(selector_font)
+                painter.setPen(QPen(muted_color, 1))
+                line2 = QFontMetrics(selector_font).elidedText(selector, Qt.TextElideMode.ElideRight, available)
+                painter.drawText(int(x + 18), int(y + 64), line2)
+        finally:
+            painter.end()
+        return pixmap
+
+    def _draw_arrow(self, painter: QPainter, start: QPointF, end: QPointF, color: str) -> None:
+        painter.setPen(_link_pen(color))
         painter.drawLine(start, end)
 
     def paintEvent(self, event) -> None:  # type: ignore[override]
         painter = QPainter(self)
-        painter.fillRect(self.rect(), QColor("#1a1a2e"))
+        painter.fillRect(event.rect(), _BACKGROUND_COLOR)
+        # Only geometry touching the damaged area is drawn; everything else is culled.
+        damage = QRectF(event.rect())
+        zoom = max(self.zoom, 1e-9)
+        clip = QRectF(damage.x() / zoom, damage.y() / zoom, damage.width() / zoom, damage.height() / zoom)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         painter.save()
         painter.scale(self.zoom, self.zoom)
         painter.setFont(self.font)
 
         if not self.steps:
-            painter.setPen(QPen(QColor("#888888"), 1))
+            painter.setPen(_EMPTY_TEXT_PEN)
             painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, "No steps")
             return
 
-        grid_pen = QPen(QColor(255, 255, 255, 18), 1)
-        painter.setPen(grid_pen)
+        painter.setPen(_GRID_PEN)
         grid = 24
-        for x in range(0, self.width() + grid, grid):
+        first_x = max(0, int(clip.left() // grid) * grid)
+        first_y = max(0, int(clip.top() // grid) * grid)
+        for x in range(first_x, min(self.width(), int(clip.right())) + grid, grid):
             painter.drawLine(x, 0, x, self.height())
-        for y in range(0, self.height() + grid, grid):
+        for y in range(first_y, min(self.height(), int(clip.bottom())) + grid, grid):
             painter.drawLine(0, y, self.width(), y)
 
-        node_color = QColor(22, 22, 42, 215)
-        start_color = QColor(6, 182, 212, 45)
-        text_color = QColor("#e8e8f0")
-        muted_color = QColor("#b0b0c8")
-        ok_color = QColor("#8b5cf6")
-        error_color = QColor("#ef4444")
-        selected_pen = QPen(QColor("#a78bfa"), 2)
-        border_pen = QPen(QColor(255, 255, 255, 28), 1)
-        input_color = QColor("#a78bfa")
-
-        positions: Dict[int, Tuple[float, float, float, float]] = {}
-
-        for idx, _ in enumerate(self.steps):
-            positions[idx] = self._node_rect(idx)
+        positions, in_pts, out_pts, segments = self._scene_geometry()
         self._last_positions = positions
-
-        def connector_points(rect):
-            x, y, w, h = rect
-            input_pt = QPointF(x - 12, y + h * 0.5)
-            ok_pt = QPointF(x + w + 14, y + h * 0.5)
-            err_pt = QPointF(x + w + 14, y + h * 0.5)
-            return input_pt, ok_pt, err_pt
-
-        # Draw arrows first for layering
-        for src, targets in self.ok_links.items():
-            if src not in positions:
+        self._link_segments = segments
+
+        # Geometry is offset-free: cull against the clip moved into the same space and
+        # shift what is drawn by the pan offset.
+        ox, oy = self.offset.x(), self.offset.y()
+        scene_clip = clip.translated(-ox, -oy)
+
+        # Draw arrows first for layering; all links of one kind go out as a single path.
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        paths = {"ok": QPainterPath(), "err": QPainterPath()}
+        clip_l, clip_t = scene_clip.left() - 2, scene_clip.top() - 2
+        clip_r, clip_b = scene_clip.right() + 2, scene_clip.bottom() + 2
+        for src, dst, kind, _, _, _, _, _, left, top, right, bottom in segments:
+            if right < clip_l or left > clip_r or bottom < clip_t or top > clip_b:
                 continue
-            _, ok_pt, _ = connector_points(positions[src])
-            for dst in targets:
-                if dst not in positions:
-                    continue
-                input_pt, _, _ = connector_points(positions[dst])
-                self._draw_arrow(painter, ok_pt, input_pt, ok_color)
-        for src, targets in self.err_links.items():
-            if src not in positions:
-                continue
-            _, _, err_pt = connector_points(positions[src])
-            for dst in targets:
-                if dst not in positions:
-                    continue
-                input_pt, _, _ = connector_points(positions[dst])
-                self._draw_arrow(painter, err_pt, input_pt, error_color)
+            path = paths[kind]
+            path.moveTo(out_pts[src])
+            path.lineTo(in_pts[dst])
+        for kind, color in (("ok", _OK_LINK_COLOR), ("err", _ERR_LINK_COLOR)):
+            if not paths[kind].isEmpty():
+                paths[kind].translate(ox, oy)
+                painter.setPen(_link_pen(color))
+                painter.drawPath(paths[kind])
 
         # Draw linking preview while dragging from a connector
         if self._linking_from is not None and self._linking_pos is not None:
             if self._linking_from in positions:
-                _, ok_pt, err_pt = connector_points(positions[self._linking_from])
-                start_pt = ok_pt if self._linking_kind == "ok" else err_pt
-                color = ok_color if self._linking_kind == "ok" else error_color
-                self._draw_arrow(painter, start_pt, self._linking_pos, color)
-
-        # Draw nodes
-        painter.setPen(Qt.PenStyle.NoPen)
-        for idx, step in enumerate(self.steps):
+                color = _OK_LINK_COLOR if self._linking_kind == "ok" else _ERR_LINK_COLOR
+                self._draw_arrow(painter, out_pts[self._linking_from] + self.offset, self._linking_pos, color)
+
+        # Draw nodes in passes grouped by painter state: bodies, input dots, output dots,
+        # then the selection outline.
+        scale = self.zoom * self.devicePixelRatioF()
+        pad = _NODE_PIXMAP_PAD
+        visible: List[int] = []
+        selected_rect: Optional[Tuple[float, float, float, float]] = None
+        steps = self.steps
+        # Same test as clip.intersects(self._node_paint_bounds(...)) without a QRectF per node.
+        left, top, right, bottom = scene_clip.left(), scene_clip.top(), scene_clip.right(), scene_clip.bottom()
+        for idx in self._nodes_in_rect(scene_clip):
             x, y, w, h = positions[idx]
-            is_start = str(step.get("action", "")).lower() == "start"
-            painter.setBrush(start_color if is_start else node_color)
-            painter.setPen(QPen(QColor("#06b6d4") if is_start else QColor(255, 255, 255, 32), 2 if is_start else 1))
-            painter.drawRoundedRect(int(x), int(y), int(w), int(h), 10, 10)
-            painter.setPen(QPen(text_color, 1))
-            tag = step.get("tag", "")
-            action = step.get("action", "")
-            action_label = self.action_labels.get(str(action), action)
-            selector = step.get("selector") or step.get("value") or step.get("url") or ""
-            if step.get("selector") and step.get("selector_type"):
-                selector = f"[{step.get('selector_type')}] {step.get('selector')}"
-            text = f"{idx + 1}. {action_label}"
-
-            # Clip and elide text so it never paints outside the node rect.
-            painter.save()
-            try:
-                painter.setClipRect(int(x), int(y), int(w), int(h))
-                metrics = painter.fontMetrics()
-                available = max(0, int(w) - 24)
-                step_text = f"Step {idx + 1}."
-                painter.setPen(QPen(QColor("#06b6d4") if is_start else QColor("#8b5cf6"), 1))
-                painter.setFont(QFont("Segoe UI", 8, QFont.Weight.DemiBold))
-                painter.drawText(int(x + 18), int(y + 22), step_text)
-                painter.setPen(QPen(text_color, 1))
-                painter.setFont(QFont("Segoe UI", 9, QFont.Weight.DemiBold))
-                header = metrics.elidedText(str(action_label), Qt.TextElideMode.ElideRight, available)
-                painter.drawText(int(x + 18), int(y + 46), header)
-                if selector:
-                    painter.setFont(QFont("Consolas", 8))
-                    painter.setPen(QPen(muted_color, 1))
-                    line2 = metrics.elidedText(str(selector), Qt.TextElideMode.ElideRight, available)
-                    painter.drawText(int(x + 18), int(y + 64), line2)
-            finally:
-                painter.restore()
-                painter.setFont(self.font)
+            if x - 16 >= right or x + w + 20 <= left or y - 4 >= bottom or y + h + 4 <= top:
+                continue
+            step = steps[idx]
+            visible.append(idx)
+            x += ox
+            y += oy
             if idx == self.selected_idx:
-                painter.setBrush(Qt.BrushStyle.NoBrush)
-                painter.setPen(selected_pen)
-                painter.drawRoundedRect(int(x - 3), int(y - 3), int(w + 6), int(h + 6), 12, 12)
-                painter.setPen(QPen(text_color, 1))
-            # connectors
-            input_pt, ok_pt, err_pt = connector_points((x, y, w, h))
-            painter.setBrush(input_color)
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawEllipse(input_pt, 4, 4)
-            painter.setBrush(ok_color)
-            painter.drawEllipse(ok_pt, 6, 6)
+                selected_rect = (x, y, w, h)
+            pixmap = self._node_pixmap(idx, step, w, h, scale)
+            painter.drawPixmap(int(x) - pad, int(y) - pad, pixmap)
+        # Connector dots are round-capped points: one drawPoints call per colour.
+        for pts, pen in ((in_pts, _INPUT_DOT_PEN), (out_pts, _OUTPUT_DOT_PEN)):
+            dots = QPolygonF([pts[idx] for idx in visible])
+            dots.translate(ox, oy)
+            painter.setPen(pen)
+            painter.drawPoints(dots)
+        if selected_rect is not None:
+            x, y, w, h = selected_rect
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.setPen(_SELECTED_PEN)
+            painter.drawRoundedRect(int(x - 3), int(y - 3), int(w + 6), int(h + 6), 12, 12)
         painter.restore()
 
+    def _node_grid(self) -> Dict[Tuple[int, int], List[int]]:
+        grid = self._hit_grid
+        if grid is None:
+            cell = self._hit_grid_cell
+            grid = {}
+            for idx, (bx, by) in enumerate(self._layout_positions()):
+                grid.setdefault((int(bx // cell), int(by // cell)), []).append(idx)
+            self._hit_grid = grid
+        return grid
+
+    def _nodes_in_rect(self, rect: QRectF) -> List[int]:
+        """Step indices whose paint bounds may intersect ``rect`` (offset-free scene coords), ascending."""
+        grid = self._node_grid()
+        cell = self._hit_grid_cell
+        # Paint bounds reach from 16px left of the corner to node_w + 20 right of it.
+        first_x = int((rect.left() - self.node_w - 20) // cell)
+        last_x = int((rect.right() + 16) // cell)
+        first_y = int((rect.top() - self.node_h - 4) // cell)
+        last_y = int((rect.bottom() + 4) // cell)
+        if (last_x - first_x + 1) * (last_y - first_y + 1) > len(grid):
+            # Zoomed far out: walking the occupied cells is cheaper than the cell range.
+            found = [
+                idx
+                for (gx, gy), members in grid.items()
+                if first_x <= gx <= last_x and first_y <= gy <= last_y
+                for idx in members
+            ]
+        else:
+            found = []
+            for gx in range(first_x, last_x + 1):
+                for gy in range(first_y, last_y + 1):
+                    found.extend(grid.get((gx, gy), ()))
+        found.sort()
+        return found
+
+    def _hit_candidates(self, pos: QPointF) -> List[int]:
+        """
+        Step indices that may contain ``pos`` (or one of their connectors), ascending.
+
+        A node plus its connector reach is narrower than a grid cell, so probing the
+        cursor's cell and its 8 neighbours finds every node that can be hit.
+        """
+        grid = self._node_grid()
+        cell = self._hit_grid_cell
+        cx = int((pos.x() - self.offset.x()) // cell)
+        cy = int((pos.y() - self.offset.y()) // cell)
+        found: List[int] = []
+        for gx in (cx - 1, cx, cx + 1):
+            for gy in (cy - 1, cy, cy + 1):
+                found.extend(grid.get((gx, gy), ()))
+        found.sort()
+        return found
+
     def _node_at(self, pos: QPointF) -> int:
-        for idx, _ in enumerate(self.steps):
+        for idx in self._hit_candidates(pos):
             x, y, w, h = self._node_rect(idx)
             if x <= pos.x() <= x + w and y <= pos.y() <= y + h:
                 return idx
@@ -314,16 +570,18 @@ class ScenarioEditor(QWidget):
 
     def _handle_hit(self, pos: QPointF):
         tolerance = 8.0
-        for idx, rect in self._last_positions.items():
+        px, py = pos.x() - self.offset.x(), pos.y() - self.offset.y()
+        for idx in self._hit_candidates(pos):
+            rect = self._last_positions.get(idx)
+            if rect is None:
+                continue
             x, y, w, h = rect
-            input_pt = QPointF(x - 10, y + h / 2)
-            ok_pt = QPointF(x + w + 10, y + h * 0.5)
-            err_pt = QPointF(x + w + 10, y + h * 0.5)
-            for kind, pt, radius in (("in", input_pt, 6.0), ("ok", ok_pt, 7.0), ("err", err_pt, 7.0)):
-                if (pos - pt).manhattanLength() <= radius + tolerance:
-                    if idx == 0 and kind == "err":
-                        continue
-                    return idx, kind
+            dy = abs(py - (y + h * 0.5))
+            if abs(px - (x - 10)) + dy <= 6.0 + tolerance:
+                return idx, "in"
+            # The ok and err handles share one point, so the ok handle always wins.
+            if abs(px - (x + w + 10)) + dy <= 7.0 + tolerance:
+                return idx, "ok"
         return None
     def _auto_pan(self, cursor_pos):
         margin = 40.0
@@ -340,7 +598,7 @@ class ScenarioEditor(QWidget):
             dy = -step
         if dx or dy:
             self.offset = QPointF(self.offset.x() + dx, self.offset.y() + dy)
-            self.update()
+            self._schedule_redraw()
 
     def mousePressEvent(self, event) -> None:  # type: ignore[override]
         if event.button() == Qt.MouseButton.LeftButton:
@@ -401,18 +659,28 @@ class ScenarioEditor(QWidget):
     def mouseMoveEvent(self, event) -> None:  # type: ignore[override]
         if self._linking_from is not None and event.buttons() & Qt.MouseButton.LeftButton:
             self._auto_pan(event.position())
+            old_pos = self._linking_pos
             self._linking_pos = event.position() / self.zoom
-            self.update()
+            src_rect = self._last_positions.get(self._linking_from)
+            if old_pos is None or src_rect is None:
+                self._schedule_redraw()
+                return
+            x, y, w, h = src_rect
+            start_pt = QPointF(x + w + 14, y + h * 0.5) + self.offset
+            dirty = QRectF(start_pt, old_pos).normalized().united(QRectF(start_pt, self._linking_pos).normalized())
+            self._update_scene_rect(dirty)
             return
         if self._dragging and self._drag_button in (Qt.MouseButton.MiddleButton, Qt.MouseButton.LeftButton):
             speed = 1.0 / max(self.zoom, 0.1)
             delta = (event.position() - self._drag_start) * speed
             self.offset = QPointF(self._offset_start.x() + delta.x(), self._offset_start.y() + delta.y())
-            self.update()
+            self._schedule_redraw()
         elif self._dragging_node and self._drag_node_idx >= 0:
             pos = event.position() / self.zoom - self._drag_offset
+            old_rect = self._last_positions.get(self._drag_node_idx)
             self.custom_positions[self._drag_node_idx] = QPointF(pos.x() - self.offset.x(), pos.y() - self.offset.y())
-            self.update()
+            self._invalidate_layout()
+            self._update_dragged_node(self._drag_node_idx, old_rect)
         else:
             super().mouseMoveEvent(event)
 
@@ -464,7 +732,7 @@ class ScenarioEditor(QWidget):
         scene_before = (cursor_pos / old_zoom) - self.offset
         self.zoom = new_zoom
         self.offset = (cursor_pos / self.zoom) - scene_before
-        self.update()
+        self._schedule_redraw()
         event.accept()
 
     def contextMenuEvent(self, event) -> None:  # type: ignore[override]
@@ -519,14 +787,19 @@ class ScenarioEditor(QWidget):
         if not src_tag or not dst_tag:
             return
         # Only one outgoing link per kind.
+        previous = links.get(src, set())
         links[src] = {dst}
         if kind == "err":
+            for old in previous:
+                self._release_err_target(old)
+            self._err_in_degree[dst] = self._err_in_degree.get(dst, 0) + 1
             self._row_map[dst] = 1
         step = self.steps[src]
         if kind == "ok":
             step["next_success_step"] = dst_tag
         else:
             step["next_error_step"] = dst_tag
+        self._invalidate_layout()
         self.update()
 
     def _remove_link(self, src: int, dst: int, kind: str) -> None:
@@ -537,41 +810,33 @@ class ScenarioEditor(QWidget):
                 self.steps[src].pop("next_success_step", None)
             else:
                 self.steps[src].pop("next_error_step", None)
-                # reset row if no other err links point to dst
-                still_err_target = any(dst in tset for tset in self.err_links.values())
-                if not still_err_target:
-                    self._row_map[dst] = 0
+                self._release_err_target(dst)
+            self._invalidate_layout()
             self.update()
 
+    def _release_err_target(self, dst: int) -> None:
+        """Drop one error link into ``dst``; the step returns to the main row once none are left."""
+        remaining = max(0, self._err_in_degree.get(dst, 0) - 1)
+        self._err_in_degree[dst] = remaining
+        if not remaining:
+            self._row_map[dst] = 0
+
     def _find_link_at(self, pos: QPointF):
-        def dist_point_to_segment(p, a, b) -> float:
-            ax, ay = a.x(), a.y()
-            bx, by = b.x(), b.y()
-            px, py = p.x(), p.y()
-            abx = bx - ax
-            aby = by - ay
-            ab_len_sq = abx * abx + aby * aby
-            if ab_len_sq == 0:
-                return math.hypot(px - ax, py - ay)
-            t = max(0.0, min(1.0, ((px - ax) * abx + (py - ay) * aby) / ab_len_sq))
-            proj_x = ax + t * abx
-            proj_y = ay + t * aby
-            return math.hypot(px - proj_x, py - proj_y)
-
-        for kind, links in (("ok", self.ok_links), ("err", self.err_links)):
-            for src, targets in links.items():
-                if src not in self._last_positions:
-                    continue
-                x, y, w, h = self._last_positions[src]
-                _, ok_pt, err_pt = QPointF(x - 10, y + h / 2), QPointF(x + w + 10, y + h * 0.4), QPointF(
-                    x + w + 10, y + h * 0.6
-                )
-                start_pt = ok_pt if kind == "ok" else err_pt
-                for dst in targets:
-                    if dst not in self._last_positions:
-                        continue
-                    dx, dy, dw, dh = self._last_positions[dst]
-                    input_pt = QPointF(dx - 10, dy + dh / 2)
-                    if dist_point_to_segment(pos, start_pt, input_pt) <= 8.0:
-                        return src, dst, kind
+        """Return (src, dst, kind) of the first painted link within 8px of ``pos``."""
+        px, py = pos.x() - self.offset.x(), pos.y() - self.offset.y()
+        limit_sq = 8.0 * 8.0
+        for src, dst, kind, ax, ay, abx, aby, inv_len_sq, left, top, right, bottom in self._link_segments:
+            if px < left - 8.0 or px > right + 8.0 or py < top - 8.0 or py > bottom + 8.0:
+                continue
+            apx = px - ax
+            apy = py - ay
+            t = (apx * abx + apy * aby) * inv_len_sq
+            if t < 0.0:
+                t = 0.0
+            elif t > 1.0:
+                t = 1.0
+            dx = apx - t * abx
+            dy = apy - t * aby
+            if dx * dx + dy * dy <= limit_sq:
+                return src, dst, kind
         return None
@@ -1,23 +1,35 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Tuple
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Dict, Mapping, Optional, Tuple
 
-from PyQt6.QtGui import QColor, QPalette
-from PyQt6.QtWidgets import QApplication, QFrame, QLabel, QVBoxLayout, QWidget
+# Qt is imported where it is used, so reading theme metadata does not load QtGui/QtWidgets.
+if TYPE_CHECKING:
+    from PyQt6.QtGui import QFont, QPalette
+    from PyQt6.QtWidgets import QApplication, QFrame, QLabel, QVBoxLayout, QWidget
 
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_CSS_PUNCT_SPACE_RE = re.compile(r"\s*([{};:,])\s*")
+_CSS_SPACE_RE = re.compile(r"\s+")
 
-PREMIUM_DARK_STYLE_SHEET = """
-* {
-    font-family: 'Inter', 'Segoe UI', 'Roboto', sans-serif;
-    color: #e8e8f0;
-    font-size: 13px;
-}
+
+def _minify_css(css: str) -> str:
+    """Drop comments and redundant whitespace so Qt's stylesheet parser has less text to tokenize."""
+    css = _CSS_COMMENT_RE.sub("", css)
+    css = _CSS_SPACE_RE.sub(" ", css)
+    return _CSS_PUNCT_SPACE_RE.sub(r"\1", css).strip()
+
+
+# NOTE: keep url(...) file references out of this sheet. QStyleSheetStyle resolves them
+# again on size-hint queries, which means filesystem hits during layout. Images belong in
+# app.ui.icons, which renders them in memory and caches the pixmaps.
+_RAW_PREMIUM_DARK_STYLE_SHEET = """
 QMainWindow, QWidget#CentralContainer {
     background: #0b0b14;
 }
-QWidget#AppShell {
-    background: #0b0b14;
-}
 QFrame#sidebar {
     background: #0d0d14;
     border-right: 1px solid rgba(255,255,255,0.06);
@@ -110,12 +122,7 @@ QListWidget#scenarioLibrary::item:selected, QListWidget#variablesList::item:sele
     color: #a78bfa;
     border: 1px solid rgba(139,92,246,0.30);
 }
-QLabel#nodePropertiesEmpty {
-    background: rgba(22,22,42,0.78);
-    border: 1px solid rgba(255,255,255,0.08);
-    border-radius: 12px;
-}
-QFrame#totalStepsCard {
+QLabel#nodePropertiesEmpty, QFrame#totalStepsCard {
     background: rgba(22,22,42,0.78);
     border: 1px solid rgba(255,255,255,0.08);
     border-radius: 12px;
@@ -135,19 +142,14 @@ QFrame#pageHeader {
     background: transparent;
     border: none;
 }
-QFrame#card, QFrame#settingsCard, QFrame#statCard, QFrame#quickAction {
+QFrame#card, QFrame#settingsCard, QFrame#statCard, QFrame#topBar {
     background: rgba(22,22,42,0.72);
     border: 1px solid rgba(255,255,255,0.08);
     border-radius: 22px;
 }
-QFrame#card:hover, QFrame#statCard:hover, QFrame#quickAction:hover {
+QFrame#card:hover, QFrame#statCard:hover {
     border-color: rgba(139,92,246,0.35);
 }
-QFrame#topBar {
-    background: rgba(22,22,42,0.72);
-    border: 1px solid rgba(255,255,255,0.08);
-    border-radius: 22px;
-}
 QWidget#profileRow {
     background: rgba(22,22,42,0.55);
     border-radius: 18px;
@@ -172,7 +174,7 @@ QLabel[class~="sectionTitle"] {
     font-weight: 700;
     color: #f4f4fb;
 }
-QLabel[class~="cardTitle"] {
+QLabel#cardTitle {
     font-size: 15px;
     font-weight: 700;
     color: #f4f4fb;
@@ -283,7 +285,8 @@ QPushButton[class~="actionOptionBtn"]:checked {
     border-color: rgba(139,92,246,0.55);
     color: #ffffff;
 }
-QLineEdit, QTextEdit, QPlainTextEdit, QComboBox, QListWidget, QTableWidget, QSpinBox, QDoubleSpinBox {
+QLineEdit, QTextEdit, QPlainTextEdit, QComboBox, QListWidget, QListView#proxyItemsList, QTableWidget,
+QSpinBox, QDoubleSpinBox {
     background: rgba(255,255,255,0.035);
     border: 1px solid rgba(255,255,255,0.10);
     border-radius: 12px;
@@ -292,7 +295,7 @@ QLineEdit, QTextEdit, QPlainTextEdit, QComboBox, QListWidget, QTableWidget, QSpi
     selection-color: #ffffff;
 }
 QLineEdit:focus, QTextEdit:focus, QPlainTextEdit:focus, QComboBox:focus,
-QListWidget:focus, QTableWidget:focus, QSpinBox:focus, QDoubleSpinBox:focus {
+QListWidget:focus, QListView#proxyItemsList:focus, QTableWidget:focus, QSpinBox:focus, QDoubleSpinBox:focus {
     border-color: rgba(139,92,246,0.55);
 }
 QComboBox::drop-down {
@@ -305,15 +308,15 @@ QComboBox QAbstractItemView {
     border-radius: 12px;
     selection-background-color: rgba(139,92,246,0.24);
 }
-QListWidget {
+QListWidget, QListView#proxyItemsList {
     border-radius: 16px;
 }
-QListWidget::item {
+QListWidget::item, QListView#proxyItemsList::item {
     margin: 5px 6px;
     padding: 10px;
     border-radius: 12px;
 }
-QListWidget::item:selected {
+QListWidget::item:selected, QListView#proxyItemsList::item:selected {
     background: rgba(139,92,246,0.20);
 }
 QListWidget#accountsList::item:selected {
@@ -393,71 +396,156 @@ QDoubleSpinBox::up-button, QDoubleSpinBox::down-button {
 """
 
 
+@lru_cache(maxsize=None)
+def _premium_dark_stylesheet() -> str:
+    # Minified on first use, so importing this module does no stylesheet work.
+    return _minify_css(_RAW_PREMIUM_DARK_STYLE_SHEET)
+
+
 DEFAULT_THEME = "premium_dark"
 
-_PREMIUM_DARK_PALETTE = {
-    QPalette.ColorRole.Window: "#0b0b14",
-    QPalette.ColorRole.Base: "#13131f",
-    QPalette.ColorRole.AlternateBase: "#1a1a2e",
-    QPalette.ColorRole.Text: "#e8e8f0",
-    QPalette.ColorRole.Button: "#1a1a2e",
-    QPalette.ColorRole.ButtonText: "#e8e8f0",
-    QPalette.ColorRole.Highlight: "#8b5cf6",
-    QPalette.ColorRole.HighlightedText: "#ffffff",
-}
 
-_THEMES: Dict[str, Dict[str, object]] = {
-    "premium_dark": {
-        "label": "Premium Dark",
-        "stylesheet": PREMIUM_DARK_STYLE_SHEET,
-        "palette": _PREMIUM_DARK_PALETTE,
-    },
-    "camouflow_dark": {
-        "label": "Premium Dark",
-        "stylesheet": PREMIUM_DARK_STYLE_SHEET,
-        "palette": _PREMIUM_DARK_PALETTE,
-    },
-    "camouflow_light": {
-        "label": "Premium Dark",
-        "stylesheet": PREMIUM_DARK_STYLE_SHEET,
-        "palette": _PREMIUM_DARK_PALETTE,
-    },
-}
+def _hex_rgba(value: str) -> Tuple[int, ...]:
+    """Parse "#rgb", "#rrggbb" or CSS-style "#rrggbbaa" into integer channels."""
+    digits = value.lstrip("#")
+    if len(digits) == 3:
+        return tuple(int(ch, 16) * 17 for ch in digits)
+    if len(digits) in (6, 8):
+        return tuple(int(digits[i : i + 2], 16) for i in range(0, len(digits), 2))
+    raise ValueError(f"Unsupported colour: {value!r}")
+
+
+def _parse_palette(colors: Mapping[str, str]) -> Mapping[str, Tuple[int, ...]]:
+    return MappingProxyType({role: _hex_rgba(value) for role, value in colors.items()})
+
+
+# QPalette.ColorRole name -> RGB(A); parsed once here, turned into QColors when the palette is built.
+_PREMIUM_DARK_PALETTE = _parse_palette(
+    {
+        "Window": "#0b0b14",
+        "Base": "#13131f",
+        "AlternateBase": "#1a1a2e",
+        "WindowText": "#e8e8f0",
+        "Text": "#e8e8f0",
+        "PlaceholderText": "#e8e8f080",
+        "Button": "#1a1a2e",
+        "ButtonText": "#e8e8f0",
+        "Highlight": "#8b5cf6",
+        "HighlightedText": "#ffffff",
+    }
+)
+
+
+# eq=False: entries are singletons compared (and hashed) by identity, so they can key caches.
+@dataclass(frozen=True, slots=True, eq=False)
+class _Theme:
+    label: str
+    stylesheet: Callable[[], str]
+    # QPalette.ColorRole name -> RGB(A) channels.
+    palette: Mapping[str, Tuple[int, ...]]
+
 
+_PREMIUM_DARK_THEME = _Theme(
+    label="Premium Dark",
+    stylesheet=_premium_dark_stylesheet,
+    palette=_PREMIUM_DARK_PALETTE,
+)
 
-def available_themes() -> List[Tuple[str, str]]:
-    return [("premium_dark", "Premium Dark")]
+# Read-only after import; the camouflow_* keys share the premium dark entry.
+_THEMES: Mapping[str, _Theme] = MappingProxyType({
+    "premium_dark": _PREMIUM_DARK_THEME,
+    "camouflow_dark": _PREMIUM_DARK_THEME,
+    "camouflow_light": _PREMIUM_DARK_THEME,
+})
+
+# Themes offered in the settings picker; the camouflow_* keys are aliases of premium_dark.
+_AVAILABLE_THEMES: Tuple[Tuple[str, str], ...] = (("premium_dark", _PREMIUM_DARK_THEME.label),)
+
+# Assembled palettes per theme entry, shared by every key aliasing it; built on first use
+# because QPalette needs a QGuiApplication.
+_palette_cache: Dict[_Theme, QPalette] = {}
+# Theme key last applied by apply_modern_theme; reapplying it would only re-polish every widget.
+_current_theme: Optional[str] = None
+
+
+def _build_palette(theme: _Theme) -> QPalette:
+    from PyQt6.QtGui import QColor, QPalette
+
+    palette = QPalette()
+    for role, rgba in theme.palette.items():
+        palette.setColor(getattr(QPalette.ColorRole, role), QColor(*rgba))
+    return palette
+
+
+def _theme_palette(key: str) -> QPalette:
+    theme = _THEMES[key]
+    palette = _palette_cache.get(theme)
+    if palette is None:
+        palette = _palette_cache[theme] = _build_palette(theme)
+    return palette
+
+
+def _app_font() -> QFont:
+    # Application-wide default instead of a universal "*" stylesheet rule, which Qt would
+    # have to match against every widget it polishes.
+    from PyQt6.QtGui import QFont
+
+    font = QFont()
+    font.setFamilies(["Inter", "Segoe UI", "Roboto", "sans-serif"])
+    font.setPixelSize(13)
+    return font
+
+
+def available_themes() -> Tuple[Tuple[str, str], ...]:
+    """(key, label) pairs for the theme picker; the table is static, so the same tuple is shared."""
+    return _AVAILABLE_THEMES
 
 
 def normalize_theme(theme: Optional[str]) -> str:
-    key = str(theme or "").strip().lower()
+    return _normalize_theme_key(str(theme or ""))
+
+
+@lru_cache(maxsize=32)
+def _normalize_theme_key(theme: str) -> str:
+    # _THEMES is read-only, so cached results never go stale.
+    key = theme.strip().lower()
     return key if key in _THEMES else DEFAULT_THEME
 
 
-def apply_modern_theme(app: QApplication, theme: str = DEFAULT_THEME) -> str:
+def apply_modern_theme(app: QApplication, theme: str = DEFAULT_THEME, *, force: bool = False) -> str:
+    global _current_theme
     key = normalize_theme(theme)
-    theme_data = _THEMES[key]
-    palette = QPalette()
-    palette_data: Dict[QPalette.ColorRole, str] = theme_data["palette"]  # type: ignore[assignment]
-    for role, color in palette_data.items():
-        palette.setColor(role, QColor(color))
-    app.setPalette(palette)
-    app.setStyleSheet(theme_data["stylesheet"])
+    if key == _current_theme and not force:
+        return key
+    app.setFont(_app_font())
+    app.setPalette(_theme_palette(key))
+    app.setStyleSheet(_THEMES[key].stylesheet())
+    _current_theme = key
     return key
 
 
-def create_card(
-    parent: Optional[QWidget] = None, title: Optional[str] = None
-) -> Tuple[QFrame, QVBoxLayout, Optional[QLabel]]:
+def create_card_frame(parent: Optional[QWidget] = None) -> Tuple[QFrame, QVBoxLayout]:
+    """Untitled card: the frame and its content layout, with no heading label."""
+    from PyQt6.QtWidgets import QFrame, QVBoxLayout
+
     frame = QFrame(parent)
     frame.setObjectName("card")
     layout = QVBoxLayout(frame)
     layout.setContentsMargins(22, 20, 22, 20)
     layout.setSpacing(14)
+    return frame, layout
+
+
+def create_card(
+    parent: Optional[QWidget] = None, title: Optional[str] = None
+) -> Tuple[QFrame, QVBoxLayout, Optional[QLabel]]:
+    frame, layout = create_card_frame(parent)
     heading = None
     if title:
+        from PyQt6.QtWidgets import QLabel
+
         heading = QLabel(title)
-        heading.setProperty("class", "cardTitle")
+        heading.setObjectName("cardTitle")
         layout.addWidget(heading)
     return frame, layout, heading
 
@@ -465,6 +553,7 @@ def create_card(
 __all__ = [
     "apply_modern_theme",
     "create_card",
+    "create_card_frame",
     "available_themes",
     "normalize_theme",
     "DEFAULT_THEME",
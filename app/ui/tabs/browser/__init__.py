@@ -34,7 +34,17 @@ def build_browser_tab(main) -> QWidget:
     header_layout.addWidget(title)
     header_layout.addWidget(subtitle)
     content.addWidget(header)
+    content.addStretch(1)
+
+    # The engine defaults card is built by build_engine_defaults_card when the tab is first shown
+    main._browser_tab_scroll = scroll
+    return tab
 
+
+def build_engine_defaults_card(main) -> None:
+    scroll = main._browser_tab_scroll
+    viewport = scroll.widget()
+    content = viewport.layout()
     card, card_layout, _ = create_card(viewport, "Engine Defaults")
     controls, tabs_widget = main._build_camoufox_controls(card)
     card_layout.addWidget(tabs_widget)
@@ -54,11 +64,13 @@ def build_browser_tab(main) -> QWidget:
     buttons.addWidget(reset_btn)
     buttons.addStretch(1)
     card_layout.addLayout(buttons)
-    content.addWidget(card)
-    content.addStretch(1)
+    # Insert above the trailing stretch. The tab is already on screen, where a layout
+    # only shows new children on the next event pass; show the card now so the first
+    # frame is laid out with it.
+    content.insertWidget(content.count() - 1, card)
+    card.show()
 
     main._camoufox_controls = controls
     main._apply_camoufox_defaults_to_form()
     save_btn.clicked.connect(main._save_camoufox_defaults)
     reset_btn.clicked.connect(main._reset_camoufox_defaults)
-    return tab
@@ -15,10 +15,18 @@ def build_logs_tab(main) -> QWidget:
     subtitle.setProperty("class", "muted")
     layout.addWidget(header)
     layout.addWidget(subtitle)
+    # The log view itself is created by build_log_view when the tab is first shown.
+    main._logs_tab = tab
+    return tab
+
+
+def build_log_view(main, max_lines: int = 0) -> QTextEdit:
+    tab = main._logs_tab
     log_card, log_layout, _ = create_card(tab, "System Events")
     main.log_edit = QTextEdit()
     main.log_edit.setReadOnly(True)
     main.log_edit.setObjectName("logView")
+    main.log_edit.document().setMaximumBlockCount(max_lines)
     log_layout.addWidget(main.log_edit)
-    layout.addWidget(log_card)
-    return tab
+    tab.layout().addWidget(log_card)
+    return main.log_edit
@@ -1,11 +1,16 @@
-from PyQt6.QtCore import Qt
+from typing import Any, Dict, List, Optional, Tuple
+
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, Qt
+from PyQt6.QtGui import QBrush, QColor
 from PyQt6.QtWidgets import (
+    QAbstractItemView,
     QHBoxLayout,
     QLabel,
+    QListView,
     QListWidget,
     QListWidgetItem,
+    QPlainTextEdit,
     QPushButton,
-    QTextEdit,
     QVBoxLayout,
     QWidget,
 )
@@ -13,6 +18,49 @@ from PyQt6.QtWidgets import (
 from app.ui.icons import lucide_icon
 from app.ui.style import create_card
 
+# (display, tooltip, foreground color or None, index in pool["proxies"])
+_ProxyItemRow = Tuple[str, str, Optional[str], int]
+
+
+class _ProxyItemsModel(QAbstractListModel):
+    """Flat list model for the proxies of the selected pool."""
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._rows: List[_ProxyItemRow] = []
+        self._brushes: Dict[str, QBrush] = {}
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = int(Qt.ItemDataRole.DisplayRole)) -> Any:
+        row = index.row()
+        if not index.isValid() or row < 0 or row >= len(self._rows):
+            return None
+        display, tooltip, color, idx = self._rows[row]
+        if role == int(Qt.ItemDataRole.DisplayRole):
+            return display
+        if role == int(Qt.ItemDataRole.ToolTipRole):
+            return tooltip
+        if role == int(Qt.ItemDataRole.ForegroundRole):
+            if color is None:
+                return None
+            brush = self._brushes.get(color)
+            if brush is None:
+                brush = self._brushes[color] = QBrush(QColor(color))
+            return brush
+        if role == int(Qt.ItemDataRole.UserRole):
+            return idx
+        return None
+
+    def set_rows(self, rows: List[_ProxyItemRow]) -> None:
+        """Replace every row with a single model reset."""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self.endResetModel()
+
 
 def build_proxies_tab(main) -> QWidget:
     tab = QWidget()
@@ -69,14 +117,20 @@ def build_proxies_tab(main) -> QWidget:
 
     details_card, details_layout, _ = create_card(tab, "Pool details")
     main.proxy_pool_title = QLabel("Select a pool")
-    main.proxy_pool_title.setProperty("class", "cardTitle")
+    main.proxy_pool_title.setObjectName("cardTitle")
     details_layout.addWidget(main.proxy_pool_title)
     main.proxy_pool_stats = QLabel("0 proxies")
     main.proxy_pool_stats.setProperty("class", "muted")
     details_layout.addWidget(main.proxy_pool_stats)
 
-    main.proxy_items_list = QListWidget()
-    main.proxy_items_list.setSelectionMode(QListWidget.SelectionMode.ExtendedSelection)
+    # Pools can hold thousands of proxies: a model-backed view avoids one
+    # QListWidgetItem per entry and lays rows out in batches.
+    main.proxy_items_list = QListView()
+    main.proxy_items_list.setObjectName("proxyItemsList")
+    main.proxy_items_list.setModel(_ProxyItemsModel(main.proxy_items_list))
+    main.proxy_items_list.setUniformItemSizes(True)
+    main.proxy_items_list.setLayoutMode(QListView.LayoutMode.Batched)
+    main.proxy_items_list.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
     main.proxy_items_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
     main.proxy_items_list.customContextMenuRequested.connect(main._show_proxy_context_menu)
     details_layout.addWidget(main.proxy_items_list, 1)
@@ -99,7 +153,7 @@ def build_proxies_tab(main) -> QWidget:
     import_label = QLabel("Bulk import (one proxy per line) — duplicates are ignored.")
     import_label.setProperty("class", "muted")
     details_layout.addWidget(import_label)
-    main.proxy_batch_input = QTextEdit()
+    main.proxy_batch_input = QPlainTextEdit()
     main.proxy_batch_input.setPlaceholderText("ip:port:login:password")
     main.proxy_batch_input.setFixedHeight(110)
     details_layout.addWidget(main.proxy_batch_input)
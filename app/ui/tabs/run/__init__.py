@@ -14,7 +14,7 @@ from PyQt6.QtWidgets import (
 )
 
 from app.ui.icons import lucide_icon
-from app.ui.style import create_card
+from app.ui.style import create_card_frame
 
 
 def build_run_tab(main) -> QWidget:
@@ -48,7 +48,7 @@ def build_run_tab(main) -> QWidget:
 
     stats = QHBoxLayout()
     stats.setSpacing(16)
-    total_card, total_layout, _ = create_card(tab)
+    total_card, total_layout = create_card_frame(tab)
     total_label = QLabel("Total Profiles")
     total_label.setProperty("class", "statLabel")
     main.profile_count_label = QLabel("0 profiles")
@@ -56,7 +56,7 @@ def build_run_tab(main) -> QWidget:
     total_layout.addWidget(total_label)
     total_layout.addWidget(main.profile_count_label)
     stats.addWidget(total_card)
-    undefined_card, undefined_layout, _ = create_card(tab)
+    undefined_card, undefined_layout = create_card_frame(tab)
     undefined_label = QLabel("Undefined")
     undefined_label.setProperty("class", "statLabel")
     main.profile_status_label = QLabel("0 undefined")
@@ -64,7 +64,7 @@ def build_run_tab(main) -> QWidget:
     undefined_layout.addWidget(undefined_label)
     undefined_layout.addWidget(main.profile_status_label)
     stats.addWidget(undefined_card)
-    running_card, running_layout, _ = create_card(tab)
+    running_card, running_layout = create_card_frame(tab)
     running_label = QLabel("Running")
     running_label.setProperty("class", "statLabel")
     main.profile_running_label = QLabel("0")
@@ -74,10 +74,10 @@ def build_run_tab(main) -> QWidget:
     stats.addWidget(running_card)
     main_layout.addLayout(stats)
 
-    list_card, list_layout, _ = create_card(tab)
+    list_card, list_layout = create_card_frame(tab)
     header_row = QHBoxLayout()
     header_label = QLabel("Profile Library")
-    header_label.setProperty("class", "cardTitle")
+    header_label.setObjectName("cardTitle")
     header_row.addWidget(header_label)
     header_row.addStretch()
     list_layout.addLayout(header_row)
@@ -86,8 +86,8 @@ def build_run_tab(main) -> QWidget:
     search_row = QHBoxLayout()
     main.accounts_search_input = QLineEdit()
     main.accounts_search_input.setPlaceholderText("Search profiles...")
-    main.accounts_search_input.setProperty("class", "search")
-    main.accounts_search_input.textChanged.connect(main._apply_accounts_filter)
+    main.accounts_search_input.setObjectName("searchInput")
+    main.accounts_search_input.textChanged.connect(lambda _: main._accounts_filter_timer.start())
     search_row.addWidget(main.accounts_search_input, 1)
     clear_btn = QPushButton("Clear")
     clear_btn.setProperty("class", "ghost")
@@ -122,6 +122,17 @@ def build_run_tab(main) -> QWidget:
     chips_layout.setContentsMargins(0, 0, 0, 0)
     chips_layout.setSpacing(8)
     main.stage_filter_layout = chips_layout
+    main._stage_filter_placeholder = QLabel("Add tags to group accounts faster.")
+    main._stage_filter_placeholder.setProperty("class", "muted")
+    chips_layout.addWidget(main._stage_filter_placeholder)
+    main._stage_filter_all_btn = QPushButton("All tags")
+    main._stage_filter_all_btn.setCheckable(True)
+    main._stage_filter_all_btn.setProperty("class", "tagChip")
+    main._stage_filter_all_btn.clicked.connect(lambda _: main._set_stage_filter(None))
+    chips_layout.addWidget(main._stage_filter_all_btn)
+    # per-tag chips are inserted before the stretch and reused by _rebuild_stage_filter_chips
+    main._chip_pool = []
+    chips_layout.addStretch()
     filter_block.addWidget(chips_widget)
     list_layout.addLayout(filter_block)
     columns_row = QHBoxLayout()
@@ -140,6 +151,11 @@ def build_run_tab(main) -> QWidget:
     main.accounts_list = QListWidget()
     main.accounts_list.setObjectName("accountsList")
     main.accounts_list.setSelectionMode(QListWidget.SelectionMode.ExtendedSelection)
+    # Lay rows out in batches so a large refilter does not stall the event loop.
+    # Uniform item sizes are not used: rows share a height but not a width, and
+    # the widest row sets the scrollable width.
+    main.accounts_list.setLayoutMode(QListWidget.LayoutMode.Batched)
+    main.accounts_list.setBatchSize(64)
     main.accounts_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
     main.accounts_list.customContextMenuRequested.connect(main._show_account_context_menu)
     main.accounts_list.itemSelectionChanged.connect(main._update_row_selection_styles)
@@ -1,4 +1,5 @@
-from typing import List, Tuple
+from types import MappingProxyType
+from typing import List, Mapping, Tuple
 
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import (
@@ -12,10 +13,10 @@ from PyQt6.QtWidgets import (
     QCheckBox,
     QLineEdit,
     QListWidget,
+    QPlainTextEdit,
     QPushButton,
     QDoubleSpinBox,
     QSpinBox,
-    QTextEdit,
     QWidget,
 )
 
@@ -47,7 +48,8 @@ ACTION_OPTIONS_FORM: List[Tuple[str, str]] = [
 ]
 
 ACTION_OPTIONS_DIALOG: List[Tuple[str, str]] = [("Start scenario", "start")] + ACTION_OPTIONS_FORM
-ACTION_LABELS = {value: label for label, value in ACTION_OPTIONS_DIALOG}
+# Shared read-only with the map view, which caches rendered nodes by label.
+ACTION_LABELS: Mapping[str, str] = MappingProxyType({value: label for label, value in ACTION_OPTIONS_DIALOG})
 
 
 def build_scenarios_tab(main) -> QWidget:
@@ -70,7 +72,7 @@ def build_scenarios_tab(main) -> QWidget:
     left_layout.setSpacing(14)
 
     scenario_title = QLabel("Scenario library", left_panel)
-    scenario_title.setProperty("class", "cardTitle")
+    scenario_title.setObjectName("cardTitle")
     left_layout.addWidget(scenario_title)
 
     main.scenario_list_widget = QListWidget()
@@ -109,7 +111,7 @@ def build_scenarios_tab(main) -> QWidget:
     left_layout.addLayout(scenario_buttons)
 
     templates_title = QLabel("Action Templates", left_panel)
-    templates_title.setProperty("class", "cardTitle")
+    templates_title.setObjectName("cardTitle")
     left_layout.addWidget(templates_title)
     template_specs = [
         ("🌐", "Navigate", "goto", "goto"),
@@ -177,7 +179,7 @@ def build_scenarios_tab(main) -> QWidget:
     right_layout.setContentsMargins(22, 22, 18, 18)
     right_layout.setSpacing(14)
     details_title = QLabel("Details", right_panel)
-    details_title.setProperty("class", "cardTitle")
+    details_title.setObjectName("cardTitle")
     right_layout.addWidget(details_title)
 
     name_label = QLabel("Name:", right_panel)
@@ -192,7 +194,7 @@ def build_scenarios_tab(main) -> QWidget:
     right_layout.addWidget(main.scenario_description_input)
 
     vars_label = QLabel("Variables in scenario:", right_panel)
-    vars_label.setProperty("class", "cardTitle")
+    vars_label.setObjectName("cardTitle")
     right_layout.addWidget(vars_label)
     main.vars_list = QListWidget()
     main.vars_list.setObjectName("variablesList")
@@ -201,7 +203,7 @@ def build_scenarios_tab(main) -> QWidget:
     add_var_btn.setProperty("class", "ghost")
     right_layout.addWidget(add_var_btn)
     props_label = QLabel("Node Properties", right_panel)
-    props_label.setProperty("class", "cardTitle")
+    props_label.setObjectName("cardTitle")
     right_layout.addWidget(props_label)
     props_empty = QLabel("Select a node to edit its properties", right_panel)
     props_empty.setObjectName("nodePropertiesEmpty")
@@ -237,15 +239,26 @@ def build_scenarios_tab(main) -> QWidget:
     main.steps_list.itemActivated.connect(lambda _: None)
     hidden_layout.addWidget(main.steps_list)
 
-    # Hidden form (logic only)
+    # Hidden step form (logic only) is built by build_step_form on first use
+    main._step_form_host = hidden_container
+
+    scenario_layout.addWidget(hidden_container)
+
+    return tab
+
+
+def build_step_form(main) -> None:
+    """Create the hidden step form widgets (``main.step_*`` / ``main.row_*``)."""
     form = QFormLayout()
     main.step_tag_input = QLineEdit()
     main.row_tag = (QLabel("Tag:"), main.step_tag_input)
     form.addRow(*main.row_tag)
 
     main.step_action_combo = QComboBox()
-    for label, value in ACTION_OPTIONS_FORM:
-        main.step_action_combo.addItem(label, value)
+    # one insertion for all labels, then attach the action values
+    main.step_action_combo.addItems([label for label, _ in ACTION_OPTIONS_FORM])
+    for idx, (_, value) in enumerate(ACTION_OPTIONS_FORM):
+        main.step_action_combo.setItemData(idx, value)
     main.step_action_combo.currentIndexChanged.connect(main._handle_action_combo_change)
     form.addRow("Action:", main.step_action_combo)
 
@@ -320,19 +333,19 @@ def build_scenarios_tab(main) -> QWidget:
     main.row_http_method = (QLabel("HTTP method:"), main.step_http_method_combo)
     form.addRow(*main.row_http_method)
 
-    main.step_http_headers_input = QTextEdit()
+    main.step_http_headers_input = QPlainTextEdit()
     main.step_http_headers_input.setPlaceholderText("Authorization: Bearer {{token}}\nAccept: application/json")
     main.step_http_headers_input.setFixedHeight(70)
     main.row_http_headers = (QLabel("HTTP headers:"), main.step_http_headers_input)
     form.addRow(*main.row_http_headers)
 
-    main.step_http_params_input = QTextEdit()
+    main.step_http_params_input = QPlainTextEdit()
     main.step_http_params_input.setPlaceholderText("q={{login}}\npage=1")
     main.step_http_params_input.setFixedHeight(60)
     main.row_http_params = (QLabel("Query params:"), main.step_http_params_input)
     form.addRow(*main.row_http_params)
 
-    main.step_http_body_input = QTextEdit()
+    main.step_http_body_input = QPlainTextEdit()
     main.step_http_body_input.setPlaceholderText("Request body (text) or JSON")
     main.step_http_body_input.setFixedHeight(90)
     main.row_http_body = (QLabel("Body:"), main.step_http_body_input)
@@ -352,7 +365,7 @@ def build_scenarios_tab(main) -> QWidget:
     main.row_http_response_var = (QLabel("Response var:"), main.step_http_response_var_input)
     form.addRow(*main.row_http_response_var)
 
-    main.step_http_extract_input = QTextEdit()
+    main.step_http_extract_input = QPlainTextEdit()
     main.step_http_extract_input.setPlaceholderText("token=$.token\nuser_id=$.user.id")
     main.step_http_extract_input.setFixedHeight(70)
     main.row_http_extract = (QLabel("Extract JSON:"), main.step_http_extract_input)
@@ -419,8 +432,4 @@ def build_scenarios_tab(main) -> QWidget:
     main.step_jump_found_input = QLineEdit()
     main.row_jump_found = (QLabel("Jump if found:"), main.step_jump_found_input)
     form.addRow(*main.row_jump_found)
-    hidden_layout.addLayout(form)
-
-    scenario_layout.addWidget(hidden_container)
-
-    return tab
+    main._step_form_host.layout().addLayout(form)
@@ -56,7 +56,7 @@ def build_settings_tab(main) -> QWidget:
 
     debug_mode_row = QHBoxLayout()
     debug_mode_label = QLabel("General")
-    debug_mode_label.setProperty("class", "cardTitle")
+    debug_mode_label.setObjectName("cardTitle")
     debug_mode_row.addWidget(debug_mode_label)
     debug_mode_row.addStretch(1)
     card_layout.addLayout(debug_mode_row)
@@ -79,14 +79,16 @@ def build_settings_tab(main) -> QWidget:
 
     appearance_row = QHBoxLayout()
     appearance_label = QLabel("Appearance")
-    appearance_label.setProperty("class", "cardTitle")
+    appearance_label.setObjectName("cardTitle")
     appearance_row.addWidget(appearance_label)
     theme_combo = QComboBox(card)
-    for value, label in available_themes():
+    themes = available_themes()
+    for value, label in themes:
         theme_combo.addItem(label, value)
+    main._theme_index = {value: idx for idx, (value, _) in enumerate(themes)}
     current_theme = getattr(main, "current_theme", None)
     if current_theme:
-        idx = theme_combo.findData(current_theme)
+        idx = main._theme_index.get(current_theme, -1)
         if idx >= 0:
             theme_combo.setCurrentIndex(idx)
     theme_combo.currentIndexChanged.connect(lambda _: main._handle_theme_selection(theme_combo.currentData()))
@@ -0,0 +1,22 @@
+"""Helpers shared by the tab builders and the main window mixins."""
+
+from contextlib import contextmanager
+from typing import Iterator
+
+from PyQt6.QtWidgets import QWidget
+
+
+@contextmanager
+def bulk_update(widget: QWidget) -> Iterator[QWidget]:
+    """
+    Repopulate ``widget`` with repaints and signals suspended, so clearing and
+    re-adding many rows costs one repaint instead of one per row. Callers that
+    rely on a selection signal must trigger it after the block.
+    """
+    signals_were_blocked = widget.blockSignals(True)
+    widget.setUpdatesEnabled(False)
+    try:
+        yield widget
+    finally:
+        widget.setUpdatesEnabled(True)
+        widget.blockSignals(signals_were_blocked)
@@ -3,16 +3,22 @@
 from __future__ import annotations
 
 import logging
-from typing import Callable
+import threading
+from collections import deque
+from typing import Callable, Deque, Tuple
 
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
 
 
 LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s [%(profile)s]: %(message)s"
 
 
 class ProfileFormatter(logging.Formatter):
-    """Formatter that tolerates third-party records without profile context."""
+    """
+    Formatter that tolerates third-party records without profile context.
+    Every handler that renders %(profile)s uses it, so no filter pass is needed
+    to default the attribute.
+    """
 
     def format(self, record: logging.LogRecord) -> str:
         if not hasattr(record, "profile") or record.profile in (None, ""):
@@ -21,7 +27,35 @@ class ProfileFormatter(logging.Formatter):
 
 
 class _GuiLogEmitter(QObject):
+    """
+    Collects formatted records from any thread and hands them to the GUI thread.
+    Only the record that finds the queue empty posts a wake-up, so a burst from a
+    worker thread costs one queued call instead of one per record.
+    """
+
     message = pyqtSignal(str, int)
+    _wake = pyqtSignal()
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._pending: Deque[Tuple[str, int]] = deque()
+        self._pending_lock = threading.Lock()
+        self._wake.connect(self._drain)
+
+    def push(self, message: str, level: int) -> None:
+        with self._pending_lock:
+            self._pending.append((message, level))
+            if len(self._pending) > 1:
+                return
+        self._wake.emit()
+
+    @pyqtSlot()
+    def _drain(self) -> None:
+        with self._pending_lock:
+            batch = list(self._pending)
+            self._pending.clear()
+        for message, level in batch:
+            self.message.emit(message, level)
 
 
 class GuiLogHandler(logging.Handler):
@@ -29,6 +63,7 @@ class GuiLogHandler(logging.Handler):
 
     def __init__(self) -> None:
         super().__init__()
+        self.setFormatter(ProfileFormatter(LOG_FORMAT))
         self._emitter = _GuiLogEmitter()
 
     def connect(self, slot: Callable[[str, int], None]) -> None:
@@ -42,11 +77,11 @@ class GuiLogHandler(logging.Handler):
                 message = record.getMessage()
             except Exception:
                 message = str(record.msg)
-        self._emitter.message.emit(message, record.levelno)
+        self._emitter.push(message, record.levelno)
 
 
 class ProfileContextFilter(logging.Filter):
-    """Ensure every log record has a profile attribute for formatting."""
+    """Ensure every log record has a profile attribute (kept for handlers without ProfileFormatter)."""
 
     def filter(self, record: logging.LogRecord) -> bool:
         if not hasattr(record, "profile") or record.profile in (None, ""):
@@ -57,5 +92,10 @@ class ProfileContextFilter(logging.Filter):
 PROFILE_FILTER = ProfileContextFilter()
 
 def install_profile_log_record_factory() -> None:
-    """Backward-compatible no-op; ProfileFormatter handles missing profile."""
+    """
+    Backward-compatible no-op; ProfileFormatter handles missing profile.
+    A record factory must not pre-set ``profile``: Logger.makeRecord refuses
+    ``extra`` keys already present on the record, which would break every
+    LoggerAdapter(..., {"profile": ...}) call.
+    """
     return
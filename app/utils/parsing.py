@@ -3,46 +3,99 @@
 from __future__ import annotations
 
 import re
-from typing import Dict, Tuple
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
 
 
 DEFAULT_ACCOUNT_TEMPLATE = "{email};{password};{secret_key};{extra};{twofa_url}"
 
+_PLACEHOLDER_RE = re.compile(r"{([^}]+)}")
+_PLACEHOLDER_SPLIT_RE = re.compile(r"{[^}]+}")
 
-def parse_account_line(line: str, template: str = DEFAULT_ACCOUNT_TEMPLATE) -> Dict[str, str]:
-    line = line.strip()
-    if not line:
-        raise ValueError("Empty account line")
-    template = template.strip() or DEFAULT_ACCOUNT_TEMPLATE
 
-    placeholders = re.findall(r"{([^}]+)}", template)
+@lru_cache(maxsize=32)
+def _template_spec(template: str) -> Tuple[Tuple[str, ...], str]:
+    """Return (placeholders, delimiter) for an account template."""
+    placeholders = tuple(_PLACEHOLDER_RE.findall(template))
     if not placeholders:
         raise ValueError("Template must contain placeholders like {email}")
     # derive delimiter from template (first non-empty separator between placeholders)
-    parts = re.split(r"{[^}]+}", template)
     delim = ";"
-    for part in parts:
+    for part in _PLACEHOLDER_SPLIT_RE.split(template):
         if part:
             delim = part
             break
+    return placeholders, delim
+
+
+def parse_account_line(line: str, template: str = DEFAULT_ACCOUNT_TEMPLATE) -> Dict[str, str]:
+    line = line.strip()
+    if not line:
+        raise ValueError("Empty account line")
+    placeholders, delim = _template_spec(template.strip() or DEFAULT_ACCOUNT_TEMPLATE)
     values = [p.strip() for p in line.split(delim)]
     if len(values) != len(placeholders):
         raise ValueError(f"Expected {len(placeholders)} fields, got {len(values)} with delimiter '{delim}'")
-    data = dict(zip(placeholders, values))
-    return {k: str(v) for k, v in data.items()}
+    return dict(zip(placeholders, values))
+
+
+class AccountLineError(ValueError):
+    """A line of a bulk account import did not match the template."""
+
+    def __init__(self, message: str, line: str) -> None:
+        super().__init__(message)
+        self.line = line
+
+
+def parse_account_lines(lines: Iterable[str], template: str = DEFAULT_ACCOUNT_TEMPLATE) -> List[Dict[str, str]]:
+    """
+    Parse every non-empty line with one template lookup for the whole batch.
+    Raises AccountLineError for the first line that does not fit, before
+    anything has been returned to the caller.
+    """
+    placeholders, delim = _template_spec(template.strip() or DEFAULT_ACCOUNT_TEMPLATE)
+    expected = len(placeholders)
+    accounts: List[Dict[str, str]] = []
+    append = accounts.append
+    for raw in lines:
+        line = raw.strip()
+        if not line:
+            continue
+        values = [p.strip() for p in line.split(delim)]
+        if len(values) != expected:
+            raise AccountLineError(
+                f"Expected {expected} fields, got {len(values)} with delimiter '{delim}'",
+                line,
+            )
+        append(dict(zip(placeholders, values)))
+    return accounts
 
 
 def parse_proxy_line(line: str) -> Tuple[str, int, str, str]:
     raw = line.strip()
-    if "://" in raw:
-        _, raw = raw.split("://", 1)
-    parts = [p.strip() for p in raw.split(":")]
+    _, sep, tail = raw.partition("://")
+    if sep:
+        raw = tail
+    parts = raw.split(":")
     if len(parts) != 4:
         raise ValueError("Proxy line must be ip:port:login:password")
     host, port_str, user, password = parts
     try:
+        # int() ignores surrounding whitespace itself
         port = int(port_str)
     except ValueError:
         raise ValueError("Proxy port must be a number")
-    return host, port, user, password
+    return host.strip(), port, user.strip(), password.strip()
+
+
+def unique_proxy_values(text: str, existing: Iterable[str] = ()) -> List[str]:
+    """Stripped, non-empty proxy lines of ``text`` in order, without duplicates or ``existing`` values."""
+    seen = set(existing)
+    values: List[str] = []
+    for raw in text.splitlines():
+        value = raw.strip()
+        if value and value not in seen:
+            seen.add(value)
+            values.append(value)
+    return values
 
@@ -0,0 +1,76 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+
+from app.ui.main_window import accounts_mixin
+from app.ui.main_window.accounts_mixin import AccountsMixin
+from app.utils.parsing import AccountLineError, parse_account_lines
+
+
+class _Importer(AccountsMixin):
+    account_parse_template = "{email};{password}"
+
+    def _save_account_template(self, template: str) -> None:
+        self.account_parse_template = template
+
+    def refresh_accounts_list(self) -> None:
+        pass
+
+    def log(self, message: str) -> None:
+        pass
+
+
+@pytest.fixture
+def import_env(monkeypatch):
+    warnings = []
+    added = []
+    monkeypatch.setattr(
+        accounts_mixin.QMessageBox, "warning", lambda _parent, title, text: warnings.append((title, text))
+    )
+    monkeypatch.setattr(accounts_mixin, "db_add_account", lambda account: added.append(account) or account)
+    return warnings, added
+
+
+def test_parse_account_lines_reports_bad_line():
+    with pytest.raises(AccountLineError) as excinfo:
+        parse_account_lines(["a@x;1", "b@x"], "{email};{password}")
+    assert excinfo.value.line == "b@x"
+
+
+def test_parse_account_lines_rejects_template_without_placeholders():
+    with pytest.raises(ValueError):
+        parse_account_lines(["a@x;1"], "email;password")
+
+
+def test_import_warns_on_template_without_placeholders(import_env):
+    warnings, added = import_env
+    result = _Importer()._import_accounts("a@x;1", None, None, "email;password")
+    assert result is None
+    assert added == []
+    assert len(warnings) == 1
+    title, text = warnings[0]
+    assert title == "Account line error"
+    assert "placeholders" in text
+    assert "Line:" not in text
+
+
+def test_import_bad_line_writes_nothing(import_env):
+    warnings, added = import_env
+    result = _Importer()._import_accounts("a@x;1\nb@x\nc@x;3", None, None, "{email};{password}")
+    assert result is None
+    assert added == []
+    assert len(warnings) == 1
+    title, text = warnings[0]
+    assert title == "Account line error"
+    assert text.endswith("Line:\nb@x")
+
+
+def test_import_adds_all_valid_lines(import_env):
+    warnings, added = import_env
+    result = _Importer()._import_accounts("a@x;1\n\nb@x;2", "tag", None, "{email};{password}")
+    assert result == (2, 0, [])
+    assert warnings == []
+    assert [acc["email"] for acc in added] == ["a@x", "b@x"]
+    assert all(acc["stage"] == "tag" for acc in added)
@@ -0,0 +1,51 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from PyQt6.QtWidgets import QApplication
+
+from app.services.scenario_debug import ScenarioDebugSession, ScenarioDebugUpdate
+from app.ui.scenario_debugger_window import ScenarioDebuggerWindow, _StepsSnapshot
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+def _update(step_index: int, total: int) -> ScenarioDebugUpdate:
+    return ScenarioDebugUpdate(
+        scenario_name="",
+        account_name="acc",
+        step_index=step_index,
+        total_steps=total,
+        action="sleep",
+        description="",
+        tag="",
+    )
+
+
+def test_apply_update_scrolls_to_current_step(qapp):
+    total = 100
+    window = ScenarioDebuggerWindow(ScenarioDebugSession())
+    try:
+        steps = [{"action": "sleep", "tag": f"step{idx}"} for idx in range(total)]
+        window._apply_loaded_steps(
+            _StepsSnapshot(window._reload_generation, ("scenario.json", 0, 0), steps, list(range(total)))
+        )
+        window.resize(520, 640)
+        window.show()
+        qapp.processEvents()
+        scrollbar = window._steps_list.verticalScrollBar()
+        start = scrollbar.value()
+
+        step_index = total - 10
+        window.apply_update(_update(step_index, total))
+        qapp.processEvents()
+
+        assert scrollbar.value() != start
+        assert window._steps_list.currentIndex().row() == window._row_for_step_index(step_index)
+        assert window._step_spin.value() == window._row_for_step_index(step_index) + 1
+    finally:
+        window.close()